@@ -186,23 +186,43 @@ __version__ = VERSION_STR
 from music21.test.testRunner import mainTest  # noqa: E402
 
 # -----------------------------------------------------------------------------
-# now import all modules to make them accessible from "import music21"
-from music21 import alpha  # noqa: E402
-from music21 import analysis  # noqa: E402
-from music21 import audioSearch  # noqa: E402
+# subpackages that nothing in the core needs are imported on first access
+# (PEP 562), so that "import music21" does not pay for format handlers,
+# the corpus, or analysis tools that a script may never use.
+_LAZY_SUBPACKAGES = frozenset([
+    'alpha',
+    'analysis',
+    'audioSearch',
+    'converter',
+    'corpus',
+    'features',
+    'graph',
+    'ipython21',
+    'languageExcerpts',
+    'midi',
+    'musicxml',
+])
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBPACKAGES:
+        import importlib
+        module = importlib.import_module('music21.' + name)
+        globals()[name] = module
+        return module
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBPACKAGES)
+
+
+# now import all other modules to make them accessible from "import music21"
 from music21 import chord  # noqa: E402
 from music21 import common  # noqa: E402
-from music21 import converter  # noqa: E402
-from music21 import corpus  # noqa: E402
-from music21 import features  # noqa: E402
 from music21 import figuredBass  # noqa: E402
-from music21 import graph  # noqa: E402
-from music21 import ipython21  # noqa: E402
-from music21 import languageExcerpts  # noqa: E402
 from music21 import metadata  # noqa: E402
 from music21 import meter  # noqa: E402
-from music21 import midi  # noqa: E402
-from music21 import musicxml  # noqa: E402
 from music21 import scale  # noqa: E402
 from music21 import search  # noqa: E402
 from music21 import stream  # noqa: E402
@@ -42,9 +42,7 @@ class StreamPlayer:  # pragma: no cover
     and play a Bach Chorale on it in real time.
 
     >>> import random
-    >>> keyDetune = []
-    >>> for i in range(127):
-    ...    keyDetune.append(random.randint(-30, 30))
+    >>> keyDetune = random.choices(range(-30, 31), k=127)
 
     >>> #_DOCS_SHOW b = corpus.parse('bwv66.6')
     >>> #_DOCS_SHOW for n in b.flatten().notes:
@@ -76,6 +76,8 @@ class ProtoM21Object:
     # a big part of iteration; from cache just 1 microsecond)
     _classTupleCacheDict: dict[type, tuple[str, ...]] = {}
     _classSetCacheDict: dict[type, frozenset[str|type]] = {}
+    # the '<module.Class' head of the repr, also made once per Class
+    _reprHeadCacheDict: dict[type, str] = {}
 
     __slots__: tuple[str, ...] = ()
 
@@ -243,12 +245,16 @@ class ProtoM21Object:
         so objects inheriting from ProtoM21Object (such as Music21Object)
         should change `_reprInternal` and not `__repr__`.
         '''
-        reprHead = '<'
-        if self.__module__ != '__main__':
-            reprHead += self.__module__ + '.'
-        reprHead += self.__class__.__qualname__
-        if '.base.' in reprHead and 'music21.base' not in reprHead:
-            reprHead = reprHead.replace('.base', '')
+        try:
+            reprHead = self._reprHeadCacheDict[self.__class__]
+        except KeyError:
+            reprHead = '<'
+            if self.__module__ != '__main__':
+                reprHead += self.__module__ + '.'
+            reprHead += self.__class__.__qualname__
+            if '.base.' in reprHead and 'music21.base' not in reprHead:
+                reprHead = reprHead.replace('.base', '')
+            self._reprHeadCacheDict[self.__class__] = reprHead
         strRepr = self._reprInternal()
         if strRepr and not strRepr.startswith(':'):
             reprHead += ' '
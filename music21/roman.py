@@ -51,6 +51,10 @@ ENDWITHFLAT_RE = re.compile(r'[b\-]$')
 # permits using internally scored pitch segments
 _scaleCache: dict[str, scale.ConcreteScale] = {}
 _keyCache: dict[str, key.Key] = {}
+# pitches (and the index of an explicitly set root, if any) and scale cardinality
+# found by RomanNumeral._updatePitches() for a figure in a Key, so that
+# the same figure in the same key does not need to be worked out again.
+_pitchesCache: dict[tuple, tuple[tuple[pitch.Pitch, ...], int|None, int]] = {}
 
 # create a single notation object for RN initialization, for type-checking,
 # but it will always be replaced.
@@ -209,18 +213,18 @@ def expandShortHand(shorthand):
     shorthand = shorthand.replace('/', '')  # this line actually seems unnecessary.
     if ENDWITHFLAT_RE.match(shorthand):
         shorthand += '3'
-    shorthand = re.sub('11', 'x', shorthand)
-    shorthand = re.sub('13', 'y', shorthand)
-    shorthand = re.sub('15', 'z', shorthand)
+    shorthand = shorthand.replace('11', 'x')
+    shorthand = shorthand.replace('13', 'y')
+    shorthand = shorthand.replace('15', 'z')
     shorthandGroups = SHORTHAND_RE.findall(shorthand)
     if len(shorthandGroups) == 1 and shorthandGroups[0].endswith('3'):
         shorthandGroups = ['5', shorthandGroups[0]]
 
     shGroupOut = []
     for sh in shorthandGroups:
-        sh = re.sub('x', '11', sh)
-        sh = re.sub('y', '13', sh)
-        sh = re.sub('z', '15', sh)
+        sh = sh.replace('x', '11')
+        sh = sh.replace('y', '13')
+        sh = sh.replace('z', '15')
         shGroupOut.append(sh)
     return shGroupOut
 
@@ -313,7 +317,7 @@ def postFigureFromChordAndKey(chordObj, keyObj=None):
     (This is in OMIT_FROM_etc.)
     '''
     if keyObj is None:
-        keyObj = key.Key(chordObj.root())
+        keyObj = _getKeyFromCache(chordObj.root().name)
     chordFigureTuples = figureTuples(chordObj, keyObj)
     bassFigureAlter = chordFigureTuples[0].alter
 
@@ -493,8 +497,9 @@ def figureTupleSolo(
     '''
     unused_scaleStep, scaleAccidental = keyObj.getScaleDegreeAndAccidentalFromPitch(pitchObj)
 
-    thisInterval = interval.Interval(bass, pitchObj)
-    aboveBass = thisInterval.diatonic.generic.mod7
+    # same as interval.Interval(bass, pitchObj).diatonic.generic.mod7,
+    # without building the Interval
+    aboveBass = (pitchObj.diatonicNoteNum - bass.diatonicNoteNum) % 7 + 1
     if scaleAccidental is None:
         rootAlterationString = ''
         alterDiff = 0.0
@@ -719,6 +724,79 @@ def correctRNAlterationForMinor(
 
     return FigureTuple(figureTuple.aboveBass, alter, rootAlterationString)
 
+
+# substitutions of figures made by romanNumeralFromChord();
+# use these when we know the key. (But don't we need to know the mode too?)
+_aug6Subs = {
+    '#ivo6b3': 'It6',
+    '#ivob64': 'It64',  # minor only
+    '#ivobb64': 'It64',  # major only
+    '#ivob5b3': 'It53',  # minor only
+    '#ivob5bb3': 'It53',  # major only
+
+    'IIø#643': 'Fr43',
+    'IIø75#3': 'Fr7',  # in minor
+    'IIø7b5#3': 'Fr7',  # in major
+    'IIø6#42': 'Fr42',  # in minor
+    'IIøb6#42': 'Fr42',  # in major
+    'IIø65': 'Fr65',  # in minor seems wrong
+    'IIø65b3': 'Fr65',  # in major
+
+    '#ii64b3': 'Sw43',
+    '#iiø7': 'Sw7',  # minor; is wrong
+    '#iib7bb53': 'Sw7',  # major
+    '#iib642': 'Sw42',  # minor
+    '#iibb642': 'Sw42',  # major
+    '#ii6b5b3': 'Sw65',  # minor
+    '#ii6b5bb3': 'Sw65',  # major
+
+    '#ivo6b5b3': 'Ger65',  # in minor
+    '#ivo6bb5b3': 'Ger65',  # in major
+    '#ivob64b3': 'Ger43',  # in minor
+    '#ivobb64bb3': 'Ger43',  # in major
+    '#ivob6b42': 'Ger42',  # in minor
+    '#ivob6bb42': 'Ger42',  # in major
+    '#ivø7': 'Ger7',  # in minor -- seems wrong
+    '#ivobb7b5bb3': 'Ger7',  # in major
+}
+_aug6NoKeyObjectSubs = {
+    'io6b3': 'It6',
+    'iob64': 'It64',
+    'iob5b3': 'It53',
+
+    'Iø64b3': 'Fr43',
+    'Iøb7b53': 'Fr7',
+    'Iøb642': 'Fr42',
+    'Iø6b5b3': 'Fr65',
+
+    'i64b3': 'Sw43',
+    'ib7bb53': 'Sw7',
+    'ibb642': 'Sw42',
+    'i6b5bb3': 'Sw65',
+
+    'io6b5b3': 'Ger65',
+    # Ger7 = iø7 -- is wrong
+    'iob64b3': 'Ger43',
+    'iob6b42': 'Ger42',
+}
+_minorSeventhSubs = {
+    'b75b3': '7',
+    '6b5': '65',
+    'b64b3': '43',
+    '6b42': '42',
+}
+_minorMajorSeventhSubs = {
+    '75b3': '7[#7]',  # major key root
+    '65': '65[#7]',  # major key 1st inversion
+    'b643': '43[#7]',  # major key second inversion
+    '6b42': '42[#7]',  # major key form of 3rd inversion mM7...
+    '#753': '#7',  # root position in minor key
+    '6#53': '65[#7]',  # minor key 1st inversion
+    '64#3': '43[#7]',  # minor key 2nd inversion
+    '42': '42[#7]',  # minor key form of 3rd inversion mM7...
+}
+
+
 def romanNumeralFromChord(
     chordObj: chord.Chord,
     keyObj: key.Key|str|None = None,
@@ -1040,76 +1118,6 @@ def romanNumeralFromChord(
     (This is in OMIT_FROM_etc.)
     '''
 
-    # use these when we know the key. (But don't we need to know the mode too?)
-    aug6subs = {
-        '#ivo6b3': 'It6',
-        '#ivob64': 'It64',  # minor only
-        '#ivobb64': 'It64',  # major only
-        '#ivob5b3': 'It53',  # minor only
-        '#ivob5bb3': 'It53',  # major only
-
-        'IIø#643': 'Fr43',
-        'IIø75#3': 'Fr7',  # in minor
-        'IIø7b5#3': 'Fr7',  # in major
-        'IIø6#42': 'Fr42',  # in minor
-        'IIøb6#42': 'Fr42',  # in major
-        'IIø65': 'Fr65',  # in minor seems wrong
-        'IIø65b3': 'Fr65',  # in major
-
-        '#ii64b3': 'Sw43',
-        '#iiø7': 'Sw7',  # minor; is wrong
-        '#iib7bb53': 'Sw7',  # major
-        '#iib642': 'Sw42',  # minor
-        '#iibb642': 'Sw42',  # major
-        '#ii6b5b3': 'Sw65',  # minor
-        '#ii6b5bb3': 'Sw65',  # major
-
-        '#ivo6b5b3': 'Ger65',  # in minor
-        '#ivo6bb5b3': 'Ger65',  # in major
-        '#ivob64b3': 'Ger43',  # in minor
-        '#ivobb64bb3': 'Ger43',  # in major
-        '#ivob6b42': 'Ger42',  # in minor
-        '#ivob6bb42': 'Ger42',  # in major
-        '#ivø7': 'Ger7',  # in minor -- seems wrong
-        '#ivobb7b5bb3': 'Ger7',  # in major
-    }
-    aug6NoKeyObjectSubs = {
-        'io6b3': 'It6',
-        'iob64': 'It64',
-        'iob5b3': 'It53',
-
-        'Iø64b3': 'Fr43',
-        'Iøb7b53': 'Fr7',
-        'Iøb642': 'Fr42',
-        'Iø6b5b3': 'Fr65',
-
-        'i64b3': 'Sw43',
-        'ib7bb53': 'Sw7',
-        'ibb642': 'Sw42',
-        'i6b5bb3': 'Sw65',
-
-        'io6b5b3': 'Ger65',
-        # Ger7 = iø7 -- is wrong
-        'iob64b3': 'Ger43',
-        'iob6b42': 'Ger42',
-    }
-    minorSeventhSubs = {
-        'b75b3': '7',
-        '6b5': '65',
-        'b64b3': '43',
-        '6b42': '42',
-    }
-    minorMajorSeventhSubs = {
-        '75b3': '7[#7]',  # major key root
-        '65': '65[#7]',  # major key 1st inversion
-        'b643': '43[#7]',  # major key second inversion
-        '6b42': '42[#7]',  # major key form of 3rd inversion mM7...
-        '#753': '#7',  # root position in minor key
-        '6#53': '65[#7]',  # minor key 1st inversion
-        '64#3': '43[#7]',  # minor key 2nd inversion
-        '42': '42[#7]',  # minor key form of 3rd inversion mM7...
-    }
-
     noKeyGiven = (keyObj is None)
 
     if not chordObj.pitches:
@@ -1135,7 +1143,7 @@ def romanNumeralFromChord(
             rootKeyObj = _getKeyFromCache(root.name.lower())
         keyObj = rootKeyObj
     elif isinstance(keyObj, str):
-        keyObj = key.Key(keyObj)
+        keyObj = _getKeyFromCache(keyObj)
 
     ft = figureTupleSolo(root, keyObj, keyObj.tonic)  # a FigureTuple
     ft = correctRNAlterationForMinor(ft, keyObj)
@@ -1169,23 +1177,23 @@ def romanNumeralFromChord(
     rnString = ft.prefix + stepRoman + inversionString
 
     if (not isMajorThird
-            and inversionString in minorSeventhSubs
+            and inversionString in _minorSeventhSubs
             # only do expensive call in case it might be possible
             and chordObj.isSeventhOfType((0, 3, 7, 10))):
-        rnString = ft.prefix + stepRoman + minorSeventhSubs[inversionString]
+        rnString = ft.prefix + stepRoman + _minorSeventhSubs[inversionString]
     elif (not isMajorThird
-              and inversionString in minorMajorSeventhSubs
+              and inversionString in _minorMajorSeventhSubs
               and chordObj.isSeventhOfType((0, 3, 7, 11))):
-        rnString = ft.prefix + stepRoman + minorMajorSeventhSubs[inversionString]
+        rnString = ft.prefix + stepRoman + _minorMajorSeventhSubs[inversionString]
 
     elif (not noKeyGiven
-          and rnString in aug6subs
+          and rnString in _aug6Subs
           and chordObj.isAugmentedSixth(permitAnyInversion=True)):
-        rnString = aug6subs[rnString]
+        rnString = _aug6Subs[rnString]
     elif (noKeyGiven
-          and rnString in aug6NoKeyObjectSubs
+          and rnString in _aug6NoKeyObjectSubs
           and chordObj.isAugmentedSixth(permitAnyInversion=True)):
-        rnString = aug6NoKeyObjectSubs[rnString]
+        rnString = _aug6NoKeyObjectSubs[rnString]
         nationalityStart = rnString[:2]  # nb: Ger = Ge
         if nationalityStart in ('It', 'Ge'):
             fifth = chordObj.fifth
@@ -1981,6 +1989,8 @@ class RomanNumeral(harmony.Harmony):
     _secondarySlashRegex = re.compile(r'(.*?)/([#a-np-zA-NP-Z].*)')
     _aug6defaultInversions = {'It': '6', 'Fr': '43', 'Ger': '65', 'Sw': '43'}
     _slashedAug6Inv = re.compile(r'(\d)/(\d)')
+    _zeroAsDiminishedRegex = re.compile(r'(?<!\d)0')
+    _dominantSeventhRegex = re.compile(r'(?P<leading>.*)d(?P<figure>7|6/?5|4/?3|4/?2|2)$')
 
     _DOC_ATTR: dict[str, str] = {
         'addedSteps': '''
@@ -2385,7 +2395,7 @@ class RomanNumeral(harmony.Harmony):
 
         # immediately fix low-preference figures
         if isinstance(figure, str):
-            figure = re.sub(r'(?<!\d)0', 'o', figure)  # viio7 (but don't alter 10.)
+            figure = self._zeroAsDiminishedRegex.sub('o', figure)  # viio7 (but don't alter 10.)
             figure = figure.replace('º', 'o')
             figure = figure.replace('°', 'o')
             # /o is just a shorthand for ø -- so it should not be stored.
@@ -2479,9 +2489,12 @@ class RomanNumeral(harmony.Harmony):
         workingFigure = self._parseBracketedAlterations(workingFigure)
 
         # Replace Neapolitan indication.
-        workingFigure = re.sub('^N6', 'bII6', workingFigure)
-        workingFigure = re.sub('^N53', 'bII', workingFigure)  # Root position must be explicit
-        workingFigure = re.sub('^N', 'bII6', workingFigure)  # First inversion assumed otherwise
+        if workingFigure.startswith('N6'):
+            workingFigure = 'bII6' + workingFigure[2:]
+        elif workingFigure.startswith('N53'):  # Root position must be explicit
+            workingFigure = 'bII' + workingFigure[3:]
+        elif workingFigure.startswith('N'):  # First inversion assumed otherwise
+            workingFigure = 'bII6' + workingFigure[1:]
 
         workingFigure = self._parseFrontAlterations(workingFigure)
         workingFigure, useScale = self._parseRNAloneAmidstAug6(workingFigure, useScale)
@@ -2513,7 +2526,7 @@ class RomanNumeral(harmony.Harmony):
             impliedQuality = 'augmented'
             # impliedQualitySymbol = '+'
         elif 'd' in workingFigure:
-            m = re.match(r'(?P<leading>.*)d(?P<figure>7|6/?5|4/?3|4/?2|2)$', workingFigure)
+            m = self._dominantSeventhRegex.match(workingFigure)
             if m is None:
                 raise RomanNumeralException(
                     f'Cannot make a dominant-seventh chord out of {workingFigure}. '
@@ -2534,7 +2547,7 @@ class RomanNumeral(harmony.Harmony):
         if not self.bracketedAlterations:
             return
         for (alterNotation, chordStep) in self.bracketedAlterations:
-            alterNotation = re.sub('b', '-', alterNotation)
+            alterNotation = alterNotation.replace('b', '-')
             try:
                 alterPitch = self.getChordStep(chordStep)
             except chord.ChordException:
@@ -2802,6 +2815,10 @@ class RomanNumeral(harmony.Harmony):
         [4, 2, 7]
 
         '''
+        # all bracketed parts of a figure start with '['; most figures have none
+        if '[' not in workingFigure:
+            self.omittedSteps = []
+            return workingFigure
         omittedSteps = []
         match = self._omittedStepsRegex.search(workingFigure)
         if match:
@@ -2833,6 +2850,9 @@ class RomanNumeral(harmony.Harmony):
         >>> rn.addedSteps
         [('--', 11)]
         '''
+        if '[' not in workingFigure:
+            self.addedSteps = []
+            return workingFigure
         addedSteps = []
         matches = self._addedStepsRegex.finditer(workingFigure)
         for m in matches:
@@ -2856,6 +2876,8 @@ class RomanNumeral(harmony.Harmony):
         [('#', 5), ('b', 3)]
 
         '''
+        if '[' not in workingFigure:
+            return workingFigure
         matches = self._bracketedAlterationRegex.finditer(workingFigure)
         for m in matches:
             matchAlteration = m.group(1)
@@ -3155,9 +3177,71 @@ class RomanNumeral(harmony.Harmony):
             else:
                 return workingFigure
 
+    def _pitchesCacheKey(self) -> tuple|None:
+        '''
+        Return a key into the module-level cache of pitches for this figure,
+        or None if the pitches cannot be cached: only RomanNumerals in a
+        :class:`~music21.key.Key` (not other scales, whose pitches may have
+        been changed) and with no root or bass already set are cached.
+
+        >>> rn = roman.RomanNumeral('V65', 'c')
+        >>> rn._pitchesCacheKey()[:4]
+        ('V65', 'C', 'minor', 'minor')
+        >>> roman.RomanNumeral('V65', scale.MajorScale('C'))._pitchesCacheKey() is None
+        True
+        '''
+        keyObj = self._scale
+        if type(keyObj) is not key.Key or self._overrides:  # pylint: disable=unidiomatic-typecheck
+            return None
+        # .mode is used in parsing the figure, while .type is what the scale
+        # was built from; they differ only if .mode was changed afterwards.
+        return (self._figure,
+                keyObj.tonic.nameWithOctave,
+                keyObj.mode,
+                keyObj.type,
+                self.caseMatters,
+                self.sixthMinor,
+                self.seventhMinor)
+
     def _updatePitches(self) -> None:
         '''
         Utility function to update the pitches to the new figure etc.
+
+        Looks up the pitches in a cache first when possible; see
+        `_pitchesCacheKey()`.
+        '''
+        cacheKey = self._pitchesCacheKey()
+        if cacheKey is None:
+            self._updatePitchesFromFigure()
+            return
+
+        try:
+            cachedPitches, rootIndex, self.scaleCardinality = _pitchesCache[cacheKey]
+        except KeyError:
+            pass
+        else:
+            self.pitches = tuple(copy.deepcopy(p) for p in cachedPitches)
+            if rootIndex is not None:
+                self.root(self.pitches[rootIndex])
+            return
+
+        self._updatePitchesFromFigure()
+        rootIndex = None
+        if 'root' in self._overrides:
+            rootPitch = self._overrides['root']
+            for i, p in enumerate(self.pitches):
+                if p is rootPitch:
+                    rootIndex = i
+                    break
+            else:
+                return  # root not among the pitches; do not cache
+        _pitchesCache[cacheKey] = (tuple(copy.deepcopy(p) for p in self.pitches),
+                                   rootIndex,
+                                   self.scaleCardinality)
+
+    def _updatePitchesFromFigure(self) -> None:
+        '''
+        Work out the pitches from the parsed figure and the key or scale.
         '''
         useScale: key.Key|scale.ConcreteScale
         if self.secondaryRomanNumeralKey is not None:
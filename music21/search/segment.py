@@ -35,8 +35,6 @@ import pathlib
 import random
 
 from music21 import common
-from music21 import converter
-from music21 import corpus
 from music21 import environment
 
 environLocal = environment.Environment('search.segment')
@@ -228,6 +226,10 @@ def indexOnePath(filePath, **keywords):
     '''
     Index a single path.  Returns a scoreDictEntry
     '''
+    # imported here so that importing search does not load every format handler
+    from music21 import converter
+    from music21 import corpus
+
     if not isinstance(filePath, pathlib.Path):
         filePath = pathlib.Path(filePath)
 
@@ -286,6 +286,15 @@ class VariantOperationsMixin:
             elif lengthType == 'replacement':
                 returnObj._insertReplacementVariant(v, matchBySpan)
 
+        if not deletionVariants and not elongationVariants:
+            # at most same-length replacements: there are no gaps to close or
+            # open and no measure numbers to fix
+            returnObj.coreElementsChanged()
+            if not inPlace:
+                return returnObj
+            else:
+                return None
+
         # Now deal with deletions before insertion variants.
         # For keeping track of which measure numbers have been removed
         deletedMeasures = []
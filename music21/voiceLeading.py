@@ -37,6 +37,7 @@ from __future__ import annotations
 
 from collections.abc import Generator
 import enum
+import functools
 import typing as t
 from music21 import base
 from music21 import chord
@@ -61,6 +62,18 @@ if t.TYPE_CHECKING:
 # to be populated the first time a VLQ object is created
 intervalCache: list[interval.Interval] = []
 
+
+@functools.lru_cache(maxsize=128)
+def _intervalFromName(name: str) -> interval.Interval:
+    '''
+    An Interval for a name such as 'P5', made once and shared between calls.
+
+    Only for comparisons within this module: the shared Interval is never
+    handed back to a caller who might change it.
+    '''
+    return interval.Interval(name)
+
+
 class MotionType(str, enum.Enum):
     antiParallel = 'Anti-Parallel'
     contrary = 'Contrary'
@@ -577,7 +590,7 @@ class VoiceLeadingQuartet(base.Music21Object):
                                      == requiredInterval.semiSimpleUndirected)
 
             if isinstance(requiredInterval, str):
-                requiredInterval = interval.Interval(requiredInterval)
+                requiredInterval = _intervalFromName(requiredInterval)
                 intervalsAreValid = (vInt0.semiSimpleName
                                         == requiredInterval.semiSimpleName
                                      and vInt1.semiSimpleName
@@ -639,11 +652,7 @@ class VoiceLeadingQuartet(base.Music21Object):
             return False
         elif self.obliqueMotion():
             return False
-        else:
-            if self.hIntervals[0].direction == self.hIntervals[1].direction:
-                return False
-            else:
-                return True
+        return self.hIntervals[0].direction != self.hIntervals[1].direction
 
     def outwardContraryMotion(self) -> bool:
         '''
@@ -722,28 +731,20 @@ class VoiceLeadingQuartet(base.Music21Object):
         '''
         if not self.contraryMotion():
             return False
-        else:
-            if self.vIntervals[0].simpleName == self.vIntervals[1].simpleName:
-                if simpleName is None:
-                    return True
-                else:
-                    if isinstance(simpleName, str):
-                        if self.vIntervals[0].simpleName == simpleName:
-                            return True
-                        else:
-                            return False
-                    else:  # assume Interval object
-                        if self.vIntervals[0].simpleName == simpleName.simpleName:
-                            return True
-                        else:
-                            return False
-            else:
-                return False
+        vSimpleName = self.vIntervals[0].simpleName
+        if vSimpleName != self.vIntervals[1].simpleName:
+            return False
+        if simpleName is None:
+            return True
+        if not isinstance(simpleName, str):  # assume Interval object
+            simpleName = simpleName.simpleName
+        return vSimpleName == simpleName
 
     def parallelInterval(self, thisInterval) -> bool:
         '''
         Returns True if there is a parallel motion or antiParallel motion of
-        this type (thisInterval should be an Interval object)
+        this type (thisInterval should be an Interval object or a string
+        such as 'P5')
 
         >>> n11 = note.Note('G4')
         >>> n12a = note.Note('A4')  # ascending 2nd
@@ -758,6 +759,11 @@ class VoiceLeadingQuartet(base.Music21Object):
         >>> vlq1.parallelInterval(interval.Interval('P8'))
         False
 
+        Interval names can be given as strings:
+
+        >>> vlq1.parallelInterval('P5')
+        True
+
         Antiparallel fifths also are True
 
         >>> n22b = note.Note('D3')  # descending 7th
@@ -912,7 +918,7 @@ class VoiceLeadingQuartet(base.Music21Object):
         N.B. -- this method finds ALL hidden intervals,
         not just those that are forbidden under traditional
         common practice counterpoint rules. Takes thisInterval,
-        an Interval object.
+        an Interval object or a string such as 'P5'.
 
         >>> n1 = note.Note('C4')
         >>> n2 = note.Note('G4')
@@ -944,7 +950,7 @@ class VoiceLeadingQuartet(base.Music21Object):
             return False
         else:
             if isinstance(thisInterval, str):
-                thisInterval = interval.Interval(thisInterval)
+                thisInterval = _intervalFromName(thisInterval)
 
             if self.vIntervals[1].simpleName == thisInterval.simpleName:
                 return True
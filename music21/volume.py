@@ -466,33 +466,35 @@ def realizeVolume(srcStream,
     # storing last relevant index lets us always start form the last-used
     # key, avoiding searching through entire list every time
     lastRelevantKeyIndex = 0
-    for e in flatSrc:  # iterate over all elements
-        if hasattr(e, 'volume') and isinstance(e, note.NotRest):
-            # try to find a dynamic
-            eStart = e.getOffsetBySite(flatSrc)
-
-            # get the most recent dynamic
-            if dynamicsAvailable and useDynamicContext is True:
-                dm = False  # set to not search dynamic context
-                for k in range(lastRelevantKeyIndex, len(bKeys)):
-                    start, end = bKeys[k]
-                    if end > eStart >= start:
-                        # store to start in the same position
-                        # for next element
-                        lastRelevantKeyIndex = k
-                        dm = boundaries[bKeys[k]]
-                        break
-            else:  # permit supplying a single dynamic context for all material
-                dm = useDynamicContext
-            # this returns a value, but all we need to do is to set the
-            # cached values stored internally
-            val = e.volume.getRealized(useDynamicContext=dm,
-                                       useVelocity=useVelocity,
-                                       useArticulations=useArticulations)
-            if setAbsoluteVelocity:
-                e.volume.velocityIsRelative = False
-                # set to velocity scalar
-                e.volume.velocityScalar = val
+    for e in flatSrc.getElementsByClass(note.NotRest):
+        # try to find a dynamic
+        eStart = e.getOffsetBySite(flatSrc)
+
+        # get the most recent dynamic
+        if dynamicsAvailable and useDynamicContext is True:
+            dm = False  # set to not search dynamic context
+            for k in range(lastRelevantKeyIndex, len(bKeys)):
+                start, end = bKeys[k]
+                if start > eStart:
+                    # keys are sorted, so no later dynamic can cover this element
+                    break
+                if end > eStart:
+                    # store to start in the same position
+                    # for next element
+                    lastRelevantKeyIndex = k
+                    dm = boundaries[bKeys[k]]
+                    break
+        else:  # permit supplying a single dynamic context for all material
+            dm = useDynamicContext
+        # this returns a value, but all we need to do is to set the
+        # cached values stored internally
+        val = e.volume.getRealized(useDynamicContext=dm,
+                                   useVelocity=useVelocity,
+                                   useArticulations=useArticulations)
+        if setAbsoluteVelocity:
+            e.volume.velocityIsRelative = False
+            # set to velocity scalar
+            e.volume.velocityScalar = val
 
 # ------------------------------------------------------------------------------
 
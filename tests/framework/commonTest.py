@@ -34,7 +34,26 @@ from music21 import common
 environLocal = environment.Environment('test.commonTest')
 
 def testCopyAll(testInstance: unittest.TestCase, globals_: typing.Dict[str, typing.Any]):
+    '''
+    Copy and deepcopy an instance of every class defined in the module under test
+    that can be created without arguments.
+
+    The sweep is slow and rarely catches anything on a per-commit run, so it is
+    skipped unless the environment variable M21_TEST_COPY_ALL is set to a
+    non-empty value, as the maincheck workflow does.
+
+    The module under test is taken from the test module's name, so
+    `tests/unit/test_stream_base.py` sweeps `music21.stream.base`; classes that
+    the test module star-imports from elsewhere are skipped.
+    '''
+    if not os.environ.get('M21_TEST_COPY_ALL'):
+        testInstance.skipTest('set M21_TEST_COPY_ALL=1 to run the copy/deepcopy sweep')
+
     my_module = testInstance.__class__.__module__
+    moduleName = my_module.rpartition('.')[2]
+    if moduleName.startswith('test_'):
+        # migrated test module: tests.unit.test_stream_base -> music21.stream.base
+        my_module = 'music21.' + moduleName[len('test_'):].replace('_', '.')
     for part, obj in globals_.items():
         match = False
         for skip in ['_', 'Test', 'Exception']:
@@ -109,7 +128,8 @@ def testImports():
     #     raise ImportError('lilypond must be installed to run test suites') from e
 
 def defaultDoctestSuite(name=None):
-    globs = __import__('music21').__dict__.copy()
+    # dir() rather than __dict__ so that lazily-imported subpackages are included
+    globs = {attr: getattr(music21, attr) for attr in dir(music21)}
     docTestOptions = (doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
     keywords = {
         'globs': globs,
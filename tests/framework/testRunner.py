@@ -60,7 +60,9 @@ def addDocAttrTestsToSuite(suite,
     '''
     dtp = doctest.DocTestParser()
     if globs is False:
-        globs = __import__(defaultImports[0]).__dict__.copy()
+        # dir() rather than __dict__ so that lazily-imported subpackages are included
+        defaultModule = __import__(defaultImports[0])
+        globs = {name: getattr(defaultModule, name) for name in dir(defaultModule)}
 
     elif globs is None:
         globs = {}
@@ -238,7 +240,8 @@ def mainTest(*testClasses, **keywords):
             pass
         else:
             for di in defaultImports:
-                globs = __import__(di).__dict__.copy()
+                defaultModule = __import__(di)
+                globs = {name: getattr(defaultModule, name) for name in dir(defaultModule)}
             if ('importPlusRelative' in testClasses
                     or 'importPlusRelative' in sys.argv
                     or bool(keywords.get('importPlusRelative', False))):
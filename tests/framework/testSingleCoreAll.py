@@ -99,7 +99,9 @@ def main(testGroup: Sequence[str] = ('test',),
 
         allLocals = [getattr(moduleObject, x) for x in dir(moduleObject)]
 
-        globs = __import__('music21').__dict__.copy()
+        # dir() rather than __dict__ so that lazily-imported subpackages are included
+        music21 = __import__('music21')
+        globs = {name: getattr(music21, name) for name in dir(music21)}
         docTestOptions = (doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
         testRunner.addDocAttrTestsToSuite(s1,
                                           allLocals,
@@ -272,6 +272,18 @@ class Test(unittest.TestCase):
         '''
         unused = corpus.parse('monteverdi/madrigal.5.3.rntxt', forceSource=True)
 
+    def runTimespanTreeInsert(self):
+        '''
+        Inserting 1000 overlapping Timespans into a TimespanTree one at a time
+        '''
+        from music21.tree import spans
+        from music21.tree import timespanTree
+
+        tss = [spans.Timespan(i, i + 5) for i in range(1000)]
+        tsTree = timespanTree.TimespanTree()
+        for timespan in tss:
+            tsTree.insert(timespan)
+
     # --------------------------------------------------------------------------
     def testTimingTolerance(self):
         '''
@@ -295,6 +307,11 @@ class Test(unittest.TestCase):
                     '2010.11.11': 3.96121883392,
                 }),
 
+            (self.runTimespanTreeInsert,
+                {
+                    '2026.10.17': 1.31,
+                }),
+
 
             #
             #
@@ -4,6 +4,14 @@
 import unittest
 
 from music21.instrument import *
+from music21 import instrument
+from music21.musicxml import m21ToXml
+from music21 import stream
+
+
+# offsets of the joined piano notes in testPartitionByInstrumentD / E
+_EXPECTED_D = (0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 9.0, 10.0, 11.0, 12.0, 13.0)
+_EXPECTED_E = (0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 9.0, 10.0, 11.0, 12.0, 13.0, 20.0)
 
 
 class Test(unittest.TestCase):
@@ -13,16 +21,14 @@ class Test(unittest.TestCase):
         testCopyAll(self, globals())
 
     def testMusicXMLExport(self):
-        from music21 import stream
-
-        s1 = stream.Stream()
+        s1 = stream.Part()
         i1 = Violin()
         i1.partName = 'test'
         s1.append(i1)
         s1.repeatAppend(note.Note(), 10)
         # s.show()
 
-        s2 = stream.Stream()
+        s2 = stream.Part()
         i2 = Piano()
         i2.partName = 'test2'
         s2.append(i2)
@@ -32,12 +38,13 @@ class Test(unittest.TestCase):
         s3.insert(0, s1)
         s3.insert(0, s2)
 
-        # s3.show()
+        raw = m21ToXml.GeneralObjectExporter().parse(s3)
+        self.assertIn(b'<part-name>test</part-name>', raw)
+        self.assertIn(b'<part-name>test2</part-name>', raw)
+        self.assertIn(b'Violin', raw)
+        self.assertIn(b'Piano', raw)
 
     def testPartitionByInstrumentA(self):
-        from music21 import instrument
-        from music21 import stream
-
         # basic case of instruments in Parts
         s = stream.Score()
         p1 = stream.Part()
@@ -65,9 +72,6 @@ class Test(unittest.TestCase):
         # post.show('t')
 
     def testPartitionByInstrumentB(self):
-        from music21 import instrument
-        from music21 import stream
-
         # basic case of instruments in Parts
         s = stream.Score()
         p1 = stream.Part()
@@ -87,9 +91,6 @@ class Test(unittest.TestCase):
         self.assertEqual(len(post.parts[1].notes), 12)
 
     def testPartitionByInstrumentC(self):
-        from music21 import instrument
-        from music21 import stream
-
         # basic case of instruments in Parts
         s = stream.Score()
         p1 = stream.Part()
@@ -124,9 +125,6 @@ class Test(unittest.TestCase):
         # post.show('t')
 
     def testPartitionByInstrumentD(self):
-        from music21 import instrument
-        from music21 import stream
-
         # basic case of instruments in Parts
         s = stream.Score()
         p1 = stream.Part()
@@ -156,16 +154,12 @@ class Test(unittest.TestCase):
         self.assertEqual(post.parts[0].getInstrument().instrumentName, 'Piano')
         self.assertEqual(len(post.parts[0].notes), 12)
 
-        self.assertEqual([n.offset for n in post.parts[0].notes],
-                         [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 9.0, 10.0, 11.0, 12.0, 13.0])
+        self.assertEqual(tuple(n.offset for n in post.parts[0].notes), _EXPECTED_D)
 
         # environLocal.printDebug(['post processing'])
         # post.show('t')
 
     def testPartitionByInstrumentE(self):
-        from music21 import instrument
-        from music21 import stream
-
         # basic case of instruments in Parts
         # s = stream.Score()
         p1 = stream.Part()
@@ -193,18 +187,9 @@ class Test(unittest.TestCase):
         self.assertEqual(post.parts[0].getInstrument().instrumentName, 'Piano')
 
         self.assertEqual(len(post.parts[0].notes), 12)
-        offsetList = []
-        ppn = post.parts[0].notes
-        for n in ppn:
-            offsetList.append(n.offset)
-
-        self.assertEqual(offsetList,
-                         [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 9.0, 10.0, 11.0, 12.0, 13.0, 20.0])
+        self.assertEqual(tuple(n.offset for n in post.parts[0].notes), _EXPECTED_E)
 
     def testPartitionByInstrumentF(self):
-        from music21 import instrument
-        from music21 import stream
-
         s1 = stream.Stream()
         s1.append(instrument.AcousticGuitar())
         s1.append(note.Note())
@@ -237,47 +222,38 @@ class Test(unittest.TestCase):
     #     for p in s2.parts:
     #         p.makeRests(fillGaps=True, inPlace=True)
 
-    def testLanguageChoice(self):
-        from music21 import instrument
-
-        # fromString
-
-        testString = 'Klarinette'  # German name
-
+    def testFromStringDefaultLanguage(self):
         # Works when language not specified
-        self.assertEqual(instrument.fromString(testString).instrumentName,
-                         testString)
+        self.assertEqual(instrument.fromString('Klarinette').instrumentName,
+                         'Klarinette')
 
+    def testFromStringMatchingLanguage(self):
+        testString = 'Klarinette'  # German name
         workingExamples = ['german',  # Works with correct language for the term
                            'German'  # Not case-sensitive, so 'German' is also fine
                            ]
-
         for langStr in workingExamples:
-            instrName = instrument.fromString(testString, language=langStr).instrumentName
-            self.assertEqual(instrName, testString)
+            with self.subTest(language=langStr):
+                instrName = instrument.fromString(testString, language=langStr).instrumentName
+                self.assertEqual(instrName, testString)
 
+    def testFromStringBadLanguage(self):
         failingExamples = ['french',  # Error when the language doesn't match the term
                            'finnish'  # Error for unsupported language
                            ]
-
         for langStr in failingExamples:
-            self.assertRaises(InstrumentException,
-                              instrument.fromString,
-                              testString,
-                              language=langStr)
-
-        # getAllNamesForInstrument
+            with self.subTest(language=langStr), self.assertRaises(InstrumentException):
+                instrument.fromString('Klarinette', language=langStr)
 
+    def testGetAllNamesForInstrumentLanguage(self):
         inst = instrument.Flute()
         # Working example
         self.assertEqual(instrument.getAllNamesForInstrument(inst,
                                                              language=SearchLanguage.ABBREVIATION),
                          {'abbreviation': ['fl']})
         # Error for unsupported language
-        self.assertRaises(InstrumentException,
-                          instrument.getAllNamesForInstrument,
-                          inst,
-                          language='finnish')
+        with self.assertRaises(InstrumentException):
+            instrument.getAllNamesForInstrument(inst, language='finnish')
 
 
 class TestExternal(unittest.TestCase):
@@ -4,6 +4,9 @@
 import unittest
 
 from music21.key import *
+from music21 import chord
+from music21 import corpus
+from music21 import stream
 
 
 class Test(unittest.TestCase):
@@ -17,7 +20,6 @@ class Test(unittest.TestCase):
         self.assertEqual(a.sharps, 0)
 
     def testSetTonic(self):
-        from music21 import chord
         k = Key()
 
         # Set tonic attribute from single pitch
@@ -32,8 +34,6 @@ class Test(unittest.TestCase):
         self.assertEqual(k.tonic.name, 'B-')
 
     def testTonalAmbiguityA(self):
-        from music21 import corpus
-        from music21 import stream
         # s = corpus.parse('bwv64.2')
         # k = s.analyze('KrumhanslSchmuckler')
         # k.tonalCertainty(method='correlationCoefficient')
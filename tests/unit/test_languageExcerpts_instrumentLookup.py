@@ -4,6 +4,10 @@
 import unittest
 
 from music21.languageExcerpts.instrumentLookup import *
+from music21 import instrument as instr
+
+
+_ALL = frozenset(allToClassName)
 
 
 class Test(unittest.TestCase):
@@ -22,9 +26,8 @@ class Test(unittest.TestCase):
                          italianToClassName,
                          russianToClassName,
                          spanishToClassName]:
-
-            for key in eachDict:
-                self.assertIn(key, allToClassName)
+            missing = eachDict.keys() - _ALL
+            self.assertFalse(missing, f'missing: {missing}')
 
     def testAllToClassNameExamples(self):
         '''
@@ -45,10 +48,12 @@ class Test(unittest.TestCase):
         '''
         Test that all class names are real.
         '''
-        from music21 import instrument as instr
-        for v in allToClassName.values():
+        names = set(allToClassName.values())
+        missing = names - vars(instr).keys()
+        for v in sorted(missing):
             with self.subTest(name=v):
                 getattr(instr, v)
+        self.assertFalse(missing, f'unknown instrument classes: {sorted(missing)}')
 
 
 if __name__ == '__main__':
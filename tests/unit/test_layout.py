@@ -4,53 +4,57 @@
 import unittest
 
 from music21.layout import *
+from music21 import corpus
+from music21 import layout
+from music21.musicxml import m21ToXml
+from music21 import note
 
 
 class Test(unittest.TestCase):
 
     def testBasic(self):
-        from music21 import note
-        from music21.musicxml import m21ToXml
         s = stream.Stream()
 
+        measures = []
         for i in range(1, 11):
             m = stream.Measure()
             m.number = i
             n = note.Note()
             m.append(n)
-            s.append(m)
+            measures.append(m)
+        s.append(measures)
 
         sl = SystemLayout()
         # sl.isNew = True  # this should not be on first system
         # as this causes all subsequent margins to be distorted
         sl.leftMargin = 300
         sl.rightMargin = 300
-        s.getElementsByClass(stream.Measure)[0].insert(0, sl)
+        measures[0].insert(0, sl)
 
         sl = SystemLayout()
         sl.isNew = True
         sl.leftMargin = 200
         sl.rightMargin = 200
         sl.distance = 40
-        s.getElementsByClass(stream.Measure)[2].insert(0, sl)
+        measures[2].insert(0, sl)
 
         sl = SystemLayout()
         sl.isNew = True
         sl.leftMargin = 220
-        s.getElementsByClass(stream.Measure)[4].insert(0, sl)
+        measures[4].insert(0, sl)
 
         sl = SystemLayout()
         sl.isNew = True
         sl.leftMargin = 60
         sl.rightMargin = 300
         sl.distance = 200
-        s.getElementsByClass(stream.Measure)[6].insert(0, sl)
+        measures[6].insert(0, sl)
 
         sl = SystemLayout()
         sl.isNew = True
         sl.leftMargin = 0
         sl.rightMargin = 0
-        s.getElementsByClass(stream.Measure)[8].insert(0, sl)
+        measures[8].insert(0, sl)
 
         # systemLayoutList = s[music21.layout.SystemLayout]
         # self.assertEqual(len(systemLayoutList), 4)
@@ -59,7 +63,6 @@ class Test(unittest.TestCase):
         unused_raw = m21ToXml.GeneralObjectExporter().parse(s)
 
     def x_testGetPageMeasureNumbers(self):
-        from music21 import corpus
         c = corpus.parse('luca/gloria').parts[0]
         # c.show('text')
         retStr = ''
@@ -73,8 +76,6 @@ class Test(unittest.TestCase):
         '''
         we have had problems with attributes disappearing.
         '''
-        from music21 import corpus
-        from music21 import layout
         lt = corpus.parse('demos/layoutTest.xml')
         ls = layout.divideByPages(lt, fastMeasures=True)
 
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+import re
 import unittest
 
-from music21.metadata.primitives import *
+from music21.metadata.primitives import Date
 
 
 class Test(unittest.TestCase):
@@ -54,14 +55,16 @@ class Test(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'Month must be.*not 13'):
             Date(month=13)
 
+        dayNotPossible = re.compile('Day.*is not possible')
         for d, m, y in ((32, None, None),
                         (0, None, None),
                         (31, 4, None),
                         (30, 2, None),
                         (29, 2, 1999),
                         ):
-            with self.assertRaisesRegex(ValueError, 'Day.*is not possible'):
-                Date(year=y, month=m, day=d)
+            with self.subTest(day=d, month=m, year=y):
+                with self.assertRaisesRegex(ValueError, dayNotPossible):
+                    Date(year=y, month=m, day=d)
 
         with self.assertRaisesRegex(ValueError, 'Hour'):
             Date(hour=24)
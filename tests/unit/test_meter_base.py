@@ -3,7 +3,7 @@
 
 import unittest
 
-from music21.meter.base import *
+from music21.meter import base
 
 
 class Test(unittest.TestCase):
@@ -12,7 +12,7 @@ class Test(unittest.TestCase):
     '''
     def testCopyAndDeepcopy(self):
         from music21.test.commonTest import testCopyAll
-        testCopyAll(self, globals())
+        testCopyAll(self, vars(base))
 
 
 if __name__ == '__main__':
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+from importlib.util import find_spec
+import itertools
 import unittest
 
-from music21.midi.realtime import *
+
+PYGAME_INSTALLED = find_spec('pygame') is not None
 
 
 class Test(unittest.TestCase):
@@ -11,20 +14,14 @@ class Test(unittest.TestCase):
 
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
-    loader = find_spec('pygame')
-    if loader is not None:  # pragma: no cover
-        pygame_installed = True
-    else:
-        pygame_installed = False
 
-    @unittest.skipUnless(pygame_installed, 'pygame is not installed')
+    @unittest.skipUnless(PYGAME_INSTALLED, 'pygame is not installed')
     def testBachDetune(self):
         from music21 import corpus
+        from music21.midi.realtime import StreamPlayer
         import random
         b = corpus.parse('bwv66.6')
-        keyDetune = []
-        for i in range(127):
-            keyDetune.append(random.randint(-30, 30))
+        keyDetune = random.choices(range(-30, 31), k=127)
         for n in b.recurse().notes:
             n.pitch.microtone = keyDetune[n.pitch.midi]
         sp = StreamPlayer(b)
@@ -46,6 +43,7 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
         '''
 
         from music21 import corpus
+        from music21.midi.realtime import StreamPlayer
         import random
 
         def busyCounter(timeList):
@@ -60,9 +58,7 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
         timeCounter.updateTime = 500  # pylint: disable=attribute-defined-outside-init
 
         b = corpus.parse('bach/bwv66.6')
-        keyDetune = []
-        for i in range(127):
-            keyDetune.append(random.randint(-30, 30))
+        keyDetune = random.choices(range(-30, 31), k=127)
         for n in b.recurse().notes:
             n.pitch.microtone = keyDetune[n.pitch.midi]
         sp = StreamPlayer(b)
@@ -70,6 +66,9 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
 
     def x_testPlayOneMeasureAtATime(self):
         from music21 import corpus
+        from music21 import defaults
+        from music21 import stream
+        from music21.midi.realtime import StreamPlayer
         defaults.ticksAtStart = 0
         b = corpus.parse('bwv66.6')
         measures = []  # store for later
@@ -88,6 +87,8 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
         '''
         # pylint: disable=attribute-defined-outside-init
         from music21 import note
+        from music21 import stream
+        from music21.midi.realtime import StreamPlayer
         import random
 
         def getRandomStream():
@@ -109,7 +110,7 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
             if currentPos < 500 <= timeCounter.lastPos:
                 timeCounter.times -= 1
                 if timeCounter.times > 0:
-                    streamPlayer.streamIn = getRandomStream()
+                    streamPlayer.streamIn = next(streamPool)
                     # timeCounter.oldIOFile = timeCounter.storedIOFile
                     timeCounter.storedIOFile = streamPlayer.getStringOrBytesIOFile()
                     streamPlayer.pygame.mixer.music.queue(timeCounter.storedIOFile)
@@ -123,6 +124,8 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
             lastPos = 1000
 
         timeCounter = TimePlayer()
+        # build the streams up front so the busy callback only has to pick one
+        streamPool = itertools.cycle([getRandomStream() for _ in range(16)])
 
         b = getRandomStream()
         sp = StreamPlayer(b)
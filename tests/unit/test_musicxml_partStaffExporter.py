@@ -1,36 +1,83 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+import copy
 import unittest
 
-from music21.musicxml.partStaffExporter import *
+from music21 import bar
+from music21 import chord
+from music21 import corpus
+from music21 import defaults
+from music21 import layout
+from music21 import meter
+from music21 import musicxml
+from music21.musicxml import helpers
+from music21.musicxml.m21ToXml import GeneralObjectExporter
+from music21.musicxml.m21ToXml import ScoreExporter
+from music21 import note
+from music21 import stream
+from music21.musicxml.xmlObjects import MusicXMLWarning
 
 
 class Test(unittest.TestCase):
 
-    def getXml(self, obj):
-        from music21.musicxml.m21ToXml import GeneralObjectExporter
+    @classmethod
+    def setUpClass(cls):
+        # GeneralObjectExporter keeps no per-call state, so one serves every getXml();
+        # a ScoreExporter is bound to its score and is made fresh in getET()
+        cls._gex = GeneralObjectExporter()
+
+        # read-only: tests that export it or reuse its objects work on a deepcopy
+        cls._schOpus19no2 = corpus.parse('schoenberg/opus19', 2)
+
+        # PartStaffs of eight and four quarter notes, with makeNotation run
+        # to freeze notation; deep-copied by testJoinPartStaffsC/D
+        cls._staffOf8 = stream.PartStaff()
+        cls._staffOf8.append([note.Note() for _ in range(8)])
+        cls._staffOf8.makeNotation(inPlace=True)
+        cls._staffOf4 = stream.PartStaff()
+        cls._staffOf4.append([note.Note() for _ in range(4)])
+        cls._staffOf4.makeNotation(inPlace=True)
 
-        gex = GeneralObjectExporter()
-        bytesOut = gex.parse(obj)
+    def getXml(self, obj):
+        bytesOut = self._gex.parse(obj)
         bytesOutUnicode = bytesOut.decode('utf-8')
         return bytesOutUnicode
 
     def getET(self, obj):
-        from music21.musicxml.m21ToXml import ScoreExporter
-
         SX = ScoreExporter(obj)
         mxScore = SX.parse()
         helpers.indent(mxScore)
         return mxScore
 
+    def getTags(self, root, tags):
+        '''
+        Collect all descendants of root with the given tags in a single walk,
+        returning a dict of tag to list of elements in document order.
+        '''
+        found = {tag: [] for tag in tags}
+        for el in root.iter():
+            if el.tag in found:
+                found[el.tag].append(el)
+        return found
+
+    def countPath(self, root, path, expected):
+        '''
+        Count the elements matching path without building a list, stopping
+        as soon as the count exceeds `expected`.
+        '''
+        n = 0
+        for _ in root.iterfind(path):
+            n += 1
+            if n > expected:
+                break
+        return n
+
     def testJoinPartStaffsA(self):
         '''
         Measure 1, staff 2 contains mid-measure treble clef in LH
         '''
-        from music21 import corpus
-        sch = corpus.parse('schoenberg/opus19', 2)
-        root = self.getET(sch)
+        root = self.getET(copy.deepcopy(self._schOpus19no2))
         # helpers.dump(root)
 
         m1 = root.find('part/measure')
@@ -45,8 +92,6 @@ class Test(unittest.TestCase):
         '''
         Gapful first PartStaff, ensure <backup> in second PartStaff correct
         '''
-        from music21 import layout
-        from music21 import note
         s = stream.Score()
         ps1 = stream.PartStaff()
         ps1.insert(0, note.Note())
@@ -58,15 +103,16 @@ class Test(unittest.TestCase):
         s.append(ps2)
         s.insert(0, layout.StaffGroup([ps1, ps2]))
         root = self.getET(s)
-        notes = root.findall('.//note')
+        tags = self.getTags(root, ('note', 'forward', 'backup'))
+        notes = tags['note']
 
         # since there are no voices in either PartStaff, the voice number of each note
         # should be the same as the staff number.
         for mxNote in notes:
             self.assertEqual(mxNote.find('voice').text, mxNote.find('staff').text)
 
-        forward = root.find('.//forward')
-        backup = root.find('.//backup')
+        forward = tags['forward'][0]
+        backup = tags['backup'][0]
         amountToBackup = (
             int(notes[0].find('duration').text)
             + int(forward.find('duration').text)
@@ -74,59 +120,46 @@ class Test(unittest.TestCase):
         )
         self.assertEqual(int(backup.find('duration').text), amountToBackup)
 
-    def testJoinPartStaffsC(self):
+    def checkUnevenPartStaffs(self, longStaffFirst):
         '''
-        First PartStaff longer than second
+        Join an eight-note and a four-note PartStaff, with the longer one
+        either first or second in the StaffGroup, and check that the
+        export has two measures and all twelve notes.
         '''
-        from music21 import layout
-        from music21 import note
         s = stream.Score()
-        ps1 = stream.PartStaff()
-        ps1.repeatAppend(note.Note(), 8)
-        ps1.makeNotation(inPlace=True)  # makeNotation to freeze notation
-        s.insert(0, ps1)
-        ps2 = stream.PartStaff()
-        ps2.repeatAppend(note.Note(), 4)
-        ps2.makeNotation(inPlace=True)  # makeNotation to freeze notation
-        s.insert(0, ps2)
-        s.insert(0, layout.StaffGroup([ps1, ps2]))
+        longStaff = copy.deepcopy(self._staffOf8)
+        shortStaff = copy.deepcopy(self._staffOf4)
+        if longStaffFirst:
+            staves = [longStaff, shortStaff]
+        else:
+            staves = [shortStaff, longStaff]
+        for ps in staves:
+            s.insert(0, ps)
+        s.insert(0, layout.StaffGroup(staves))
         root = self.getET(s)
-        measures = root.findall('.//measure')
-        notes = root.findall('.//note')
-        self.assertEqual(len(measures), 2)
-        self.assertEqual(len(notes), 12)
+        tags = self.getTags(root, ('measure', 'note'))
+        # from music21.musicxml.helpers import dump
+        # dump(root)
+        self.assertEqual(len(tags['measure']), 2)
+        self.assertEqual(len(tags['note']), 12)
+
+    def testJoinPartStaffsC(self):
+        '''
+        First PartStaff longer than second
+        '''
+        self.checkUnevenPartStaffs(longStaffFirst=True)
 
     def testJoinPartStaffsD(self):
         '''
         Same example as testJoinPartStaffsC but switch the hands:
         second PartStaff longer than first
         '''
-        from music21 import layout
-        from music21 import note
-        s = stream.Score()
-        ps1 = stream.PartStaff()
-        ps1.repeatAppend(note.Note(), 8)
-        ps1.makeNotation(inPlace=True)  # makeNotation to freeze notation
-        ps2 = stream.PartStaff()
-        ps2.repeatAppend(note.Note(), 4)
-        ps2.makeNotation(inPlace=True)  # makeNotation to freeze notation
-        s.insert(0, ps2)
-        s.insert(0, ps1)
-        s.insert(0, layout.StaffGroup([ps2, ps1]))
-        root = self.getET(s)
-        measures = root.findall('.//measure')
-        notes = root.findall('.//note')
-        # from music21.musicxml.helpers import dump
-        # dump(root)
-        self.assertEqual(len(measures), 2)
-        self.assertEqual(len(notes), 12)
+        self.checkUnevenPartStaffs(longStaffFirst=False)
 
     def testJoinPartStaffsD2(self):
         '''
         Add measures and voices and check for unique voice numbers across the StaffGroup.
         '''
-        from music21 import layout
-        from music21 import note
         s = stream.Score()
         ps1 = stream.PartStaff()
         m1 = stream.Measure()
@@ -154,36 +187,34 @@ class Test(unittest.TestCase):
         s.insert(0, ps1)
         s.insert(0, layout.StaffGroup([ps1, ps2]))
         root = self.getET(s)
-        measures = root.findall('.//measure')
-        notes = root.findall('.//note')
+        tags = self.getTags(root, ('measure', 'note'))
+        measures = tags['measure']
+        notes = tags['note']
         # from music21.musicxml.helpers import dump
         # dump(root)
         self.assertEqual(len(measures), 1)
         self.assertEqual(len(notes), 16)
 
         # check those voice and staff numbers
-        for mxNote in notes:
-            mxPitch = mxNote.find('pitch')
-            if mxPitch.find('step').text == 'C' and mxPitch.find('octave').text == '4':
-                self.assertEqual(mxNote.find('voice').text, '1')
-                self.assertEqual(mxNote.find('staff').text, '1')
-            elif mxPitch.find('step').text == 'E' and mxPitch.find('octave').text == '4':
-                self.assertEqual(mxNote.find('voice').text, '2')
-                self.assertEqual(mxNote.find('staff').text, '1')
-            elif mxPitch.find('step').text == 'C' and mxPitch.find('octave').text == '3':
-                self.assertEqual(mxNote.find('voice').text, '3')
-                self.assertEqual(mxNote.find('staff').text, '2')
-            elif mxPitch.find('step').text == 'G' and mxPitch.find('octave').text == '3':
-                self.assertEqual(mxNote.find('voice').text, '4')
-                self.assertEqual(mxNote.find('staff').text, '2')
+        expectedVoiceStaff = {
+            ('C', '4'): ('1', '1'),
+            ('E', '4'): ('2', '1'),
+            ('C', '3'): ('3', '2'),
+            ('G', '3'): ('4', '2'),
+        }
+        rows = [(mxNote.findtext('pitch/step'),
+                 mxNote.findtext('pitch/octave'),
+                 mxNote.findtext('voice'),
+                 mxNote.findtext('staff')) for mxNote in notes]
+        for step, octave, voice, staff in rows:
+            if (step, octave) in expectedVoiceStaff:
+                self.assertEqual((voice, staff), expectedVoiceStaff[step, octave])
 
     def testJoinPartStaffsE(self):
         '''
         Measure numbers existing only in certain PartStaffs: don't collapse together
         '''
-        from music21 import corpus
-        from music21 import layout
-        sch = corpus.parse('schoenberg/opus19', 2)
+        sch = self._schOpus19no2
 
         s = stream.Score()
         ps1 = stream.PartStaff()
@@ -191,9 +222,9 @@ class Test(unittest.TestCase):
         s.append(ps1)
         s.append(ps2)
         s.insert(0, layout.StaffGroup([ps1, ps2]))
-        m1 = sch.parts[0].measure(1)  # RH
-        m2 = sch.parts[1].measure(2)  # LH
-        m3 = sch.parts[0].measure(3)  # RH
+        m1 = copy.deepcopy(sch.parts[0].measure(1))  # RH
+        m2 = copy.deepcopy(sch.parts[1].measure(2))  # LH
+        m3 = copy.deepcopy(sch.parts[0].measure(3))  # RH
         ps1.append(m1)
         ps1.append(m3)
         ps2.insert(m1.offset, m2)
@@ -207,9 +238,7 @@ class Test(unittest.TestCase):
         '''
         Flattening the score will leave StaffGroup spanners with parts no longer in the stream.
         '''
-        from music21 import corpus
-        from music21 import musicxml
-        sch = corpus.parse('schoenberg/opus19', 2)
+        sch = copy.deepcopy(self._schOpus19no2)
 
         # NB: Using ScoreExporter directly is an advanced use case:
         # does not run makeNotation(), so here GeneralObjectExporter is used first
@@ -227,8 +256,6 @@ class Test(unittest.TestCase):
         '''
         A derived score should still have joinable groups.
         '''
-        from music21 import corpus
-        from music21 import musicxml
         s = corpus.parse('demos/two-parts')
 
         m1 = s.measure(1)
@@ -243,13 +270,12 @@ class Test(unittest.TestCase):
         Overlapping PartStaffs cannot be guaranteed to export correctly,
         so they fall back to the old export paradigm (no joinable groups).
         '''
-        from music21 import musicxml
 
         ps1 = stream.PartStaff(stream.Measure())
         ps2 = stream.PartStaff(stream.Measure())
         ps3 = stream.PartStaff(stream.Measure())
-        sg1 = StaffGroup([ps1, ps2])
-        sg2 = StaffGroup([ps1, ps3])
+        sg1 = layout.StaffGroup([ps1, ps2])
+        sg2 = layout.StaffGroup([ps1, ps3])
         s = stream.Score([ps1, ps2, ps3, sg1, sg2])
 
         SX = musicxml.m21ToXml.ScoreExporter(s)
@@ -263,18 +289,12 @@ class Test(unittest.TestCase):
         Regression test for side effects on the stream passed to ScoreExporter
         preventing it from being written out again.
         '''
-        from music21 import corpus
-        from music21.musicxml.m21ToXml import ScoreExporter
         b = corpus.parse('cpebach')
         SX = ScoreExporter(b)
         SX.parse()
         SX.parse()
 
     def testMeterChanges(self):
-        from music21 import layout
-        from music21 import meter
-        from music21 import note
-
         ps1 = stream.PartStaff()
         ps2 = stream.PartStaff()
         sg = layout.StaffGroup([ps1, ps2])
@@ -287,20 +307,17 @@ class Test(unittest.TestCase):
 
         root = self.getET(s)
         # Just two <attributes> tags, a 3/1 in measure 1 and a 4/1 in measure 2
-        self.assertEqual(len(root.findall('part/measure/attributes/time')), 2)
+        self.assertEqual(self.countPath(root, 'part/measure/attributes/time', 2), 2)
 
         # Edge cases -- no expectation of correctness, just don't crash
         ps1[stream.Measure].last().number = 0  # was measure 2
         root = self.getET(s)
-        self.assertEqual(len(root.findall('part/measure/attributes/time')), 3)
+        self.assertEqual(self.countPath(root, 'part/measure/attributes/time', 3), 3)
 
     def testBackupAmount(self):
         '''
         Regression test for chord members causing too-large backup amounts.
         '''
-        from music21 import chord
-        from music21 import defaults
-        from music21 import layout
 
         ps1 = stream.PartStaff(chord.Chord('C E G'))
         ps2 = stream.PartStaff(chord.Chord('D F A'))
@@ -317,9 +334,6 @@ class Test(unittest.TestCase):
         '''
         Regression test for losing forward repeat marks.
         '''
-        from music21 import bar
-        from music21 import layout
-        from music21 import note
 
         measureRH = stream.Measure(
             [bar.Repeat(direction='start'), note.Note(type='whole')])
@@ -2,8 +2,9 @@
 # Migrated from embedded tests
 
 import unittest
+from xml.etree import ElementTree as ET
 
-from music21.musicxml.testPrimitive import *
+from music21.musicxml.testPrimitive import ALL
 
 
 class Test(unittest.TestCase):
@@ -38,15 +39,18 @@ class Test(unittest.TestCase):
         orig_clefs = orig_stream.flatten().getElementsByClass(clef.Clef)
 
         xml = musicxml.m21ToXml.GeneralObjectExporter().parse(orig_stream)
-        self.assertEqual(xml.count(b'<clef>'), 2)  # clefs got out
-        self.assertEqual(xml.count(b'<measure'), 1)  # in one measure
+        mxScore = ET.fromstring(xml)
+        self.assertEqual(len(mxScore.findall('.//clef')), 2)  # clefs got out
+        self.assertEqual(len(mxScore.findall('.//measure')), 1)  # in one measure
 
         new_stream = converter.parse(xml)
         new_clefs = new_stream.flatten().getElementsByClass(clef.Clef)
 
         self.assertEqual(len(new_clefs), len(orig_clefs))
-        self.assertEqual([c.offset for c in new_clefs], [c.offset for c in orig_clefs])
-        self.assertEqual([c.classes for c in new_clefs], [c.classes for c in orig_clefs])
+        self.assertEqual(tuple(c.offset for c in new_clefs),
+                         tuple(c.offset for c in orig_clefs))
+        self.assertEqual(tuple(c.classes for c in new_clefs),
+                         tuple(c.classes for c in orig_clefs))
 
     def testMidMeasureClefs2(self):
         '''
@@ -3,13 +3,13 @@
 
 import unittest
 
-from music21.prebase import *
+from music21 import prebase
 
 
 class Test(unittest.TestCase):
     def testCopyAndDeepcopy(self):
         from music21.test.commonTest import testCopyAll
-        testCopyAll(self, globals())
+        testCopyAll(self, vars(prebase))
 
     def test_reprInternal(self):
         from music21.base import Music21Object
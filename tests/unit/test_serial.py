@@ -12,7 +12,7 @@ class Test(unittest.TestCase):
         src = getHistoricalRowByName('SchoenbergOp37')
         self.assertEqual([p.name for p in src],
                          ['D', 'C#', 'A', 'B-', 'F', 'E-', 'E', 'C', 'G#', 'G', 'F#', 'B'])
-        s37 = getHistoricalRowByName('SchoenbergOp37').matrix()
+        s37 = src.matrix()
         r0 = s37[0]
         self.assertEqual([e.name for e in r0],
                          ['C', 'B', 'G', 'G#', 'E-', 'C#', 'D', 'B-', 'F#', 'F', 'E', 'A'])
@@ -22,11 +22,12 @@ class Test(unittest.TestCase):
         series = {'a': 1, 'g-': 2, 'g': 3, 'a-': 4,
                   'f': 5, 'e-': 6, 'e': 7, 'd': 8,
                   'c': 9, 'c#': 10, 'b-': 11, 'b': 12}
+        pcMap = {pitch.Pitch(key).pitchClass: number for key, number in series.items()}
         s = corpus.parse('bwv66.6')
         for n in s.flatten().notes:
-            for key in series:
-                if n.pitch.pitchClass == pitch.Pitch(key).pitchClass:
-                    n.addLyric(series[key])
+            number = pcMap.get(n.pitch.pitchClass)
+            if number is not None:
+                n.addLyric(number)
         match = []
         for n in s.parts[0].flatten().notes:
             match.append(n.lyric)
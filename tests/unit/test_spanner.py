@@ -1,18 +1,67 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+from collections import Counter
+import re
 import unittest
 
 from music21.spanner import *
+from music21 import articulations
+from music21 import bar
+from music21 import chord
+from music21 import clef
+from music21 import converter
+from music21 import dynamics
+from music21 import layout
+from music21 import note
+from music21 import spanner
+from music21 import stream
 
 
-class Test(unittest.TestCase):
+# the <ending> tags written for RepeatBrackets, found in a single pass over the xml
+_ENDING_RE = re.compile(r'<ending number="(\d+)" type="(start|stop|discontinue)" />')
+
+
+def _endings(raw):
+    '''
+    Return the set of (number, type) pairs of the <ending> tags in raw.
+    '''
+    return {m.groups() for m in _ENDING_RE.finditer(raw)}
+
+
+def _snippetCounts(raw, *snippets):
+    '''
+    Count how often each literal snippet appears in raw, in a single pass.
 
-    def setUp(self):
-        from music21.musicxml.m21ToXml import GeneralObjectExporter
-        self.GEX = GeneralObjectExporter()
+    No snippet may be a prefix of another, since the first alternative wins.
+    '''
+    pattern = re.compile('|'.join(re.escape(snippet) for snippet in snippets))
+    return Counter(m.group(0) for m in pattern.finditer(raw))
+
+
+# semitones to transpose the i-th note of a glissando test by:
+# i, plus an octave on every odd note, so the line zig-zags
+_GLISSANDO_STEPS = tuple(i + (i % 2 * 12) for i in range(12))
+
+
+class Test(unittest.TestCase):
+    # made by the first call to xmlStr, then shared by every later test
+    GEX = None
+
+    @classmethod
+    def setUpClass(cls):
+        # the first five measures of testRepeatBracketC and D; those tests
+        # add their own barlines and RepeatBrackets to a deepcopy
+        cls._repeatPart = stream.Part()
+        for pitchName in ('c4', 'd#4', 'g#4', 'a4', 'b4'):
+            m = stream.Measure()
+            m.repeatAppend(note.Note(pitchName), 4)
+            cls._repeatPart.append(m)
 
     def xmlStr(self, obj):
+        if self.GEX is None:
+            from music21.musicxml.m21ToXml import GeneralObjectExporter
+            Test.GEX = GeneralObjectExporter()
         xmlBytes = self.GEX.parse(obj)
         return xmlBytes.decode('utf-8')
 
@@ -21,11 +70,7 @@ class Test(unittest.TestCase):
         testCopyAll(self, globals())
 
     def testBasic(self):
-
         # how parts might be grouped
-        from music21 import stream
-        from music21 import note
-        from music21 import layout
         s = stream.Score()
         p1 = stream.Part()
         p2 = stream.Part()
@@ -66,15 +111,11 @@ class Test(unittest.TestCase):
         sl2 = Slur()
         sl3 = Slur()
         sp = Spanner([sl1, sl2, sl3])
-        self.assertEqual(len(sp.getSpannedElements()), 3)
         self.assertEqual(sp.getSpannedElements(), [sl1, sl2, sl3])
 
         self.assertEqual(sl1.getSpannerSites(), [sp])
 
     def testSpannerAnchorRepr(self):
-        from music21 import stream
-        from music21 import spanner
-
         # SpannerAnchor with no activeSite
         sa1 = spanner.SpannerAnchor()
         self.assertEqual(repr(sa1), '<music21.spanner.SpannerAnchor unanchored>')
@@ -89,76 +130,71 @@ class Test(unittest.TestCase):
         self.assertEqual(repr(sa1), '<music21.spanner.SpannerAnchor at 0.5-3.0>')
 
     def testSpannerRepr(self):
-        from music21 import spanner
         su1 = spanner.Slur()
         self.assertEqual(repr(su1), '<music21.spanner.Slur>')
 
     def testSpannerFill(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import spanner
+        # fill() only reads the measure, so every scenario below searches the same one
         theNotes = [note.Note('A'), note.Note('B'), note.Note('C'), note.Note('D')]
         m = stream.Measure(theNotes)
-
-        # Spanner with no fillElementTypes
-        sp = spanner.Spanner(theNotes[0], theNotes[3])
-        sp.fill(m)
-        # should not have done anything
         noFillElements = [theNotes[0], theNotes[3]]
-        self.assertEqual(len(sp), 2)
-        for i, el in enumerate(sp.getSpannedElements()):
-            self.assertIs(el, noFillElements[i])
-
-        # Ottava with filledStatus == True
-        ott1 = spanner.Ottava(noFillElements)
-        ott1.filledStatus = True  # pretend it has already been filled
-        ott1.fill(m)
-        # should not have done anything
-        self.assertEqual(len(sp), 2)
-        for i, el in enumerate(sp.getSpannedElements()):
-            self.assertIs(el, noFillElements[i])
-
-        # same Ottava but with filledStatus == False
-        ott1.filledStatus = False
-        ott1.fill(m)
-        # ott1 should have been filled
-        self.assertIs(ott1.filledStatus, True)
-        self.assertEqual(len(ott1), 4)
-        for i, el in enumerate(ott1.getSpannedElements()):
-            self.assertIs(el, theNotes[i])
-
-        # Ottava with no elements
-        ott2 = spanner.Ottava()
-        ott2.fill(m)
-        self.assertEqual(len(ott2), 0)
-
-        # Ottava with only element not in searchStream
-        expectedElements = [note.Note('E')]
-        ott3 = spanner.Ottava(expectedElements)
-        ott3.fill(m)
-        self.assertEqual(len(ott3), 1)
-        self.assertIs(ott3.getFirst(), expectedElements[0])
-
-        # Ottava with start element not in searchStream, end element is
-        expectedElements = [note.Note('F'), m.notes[0]]
-        ott4 = spanner.Ottava(expectedElements)
-        ott4.fill(m)
-        self.assertEqual(len(ott4), 2)
-        for i, el in enumerate(ott4.getSpannedElements()):
-            self.assertIs(el, expectedElements[i])
-
-        # Ottava with endElement not in searchStream, startElement is
-        expectedElements = [m.notes[0], note.Note('G')]
-        ott5 = spanner.Ottava(expectedElements)
-        ott5.fill(m)
-        self.assertEqual(len(ott5), 2)
-        for i, el in enumerate(ott5.getSpannedElements()):
-            self.assertIs(el, expectedElements[i])
 
-    def testSpannerBundle(self):
-        from music21 import spanner
-        from music21 import stream
+        with self.subTest(scenario='Spanner with no fillElementTypes'):
+            sp = spanner.Spanner(theNotes[0], theNotes[3])
+            sp.fill(m)
+            # should not have done anything
+            self.assertEqual(len(sp), 2)
+            for i, el in enumerate(sp.getSpannedElements()):
+                self.assertIs(el, noFillElements[i])
+
+        with self.subTest(scenario='Ottava with filledStatus'):
+            # Ottava with filledStatus == True
+            ott1 = spanner.Ottava(noFillElements)
+            ott1.filledStatus = True  # pretend it has already been filled
+            ott1.fill(m)
+            # should not have done anything
+            self.assertEqual(len(ott1), 2)
+            for i, el in enumerate(ott1.getSpannedElements()):
+                self.assertIs(el, noFillElements[i])
+
+            # same Ottava but with filledStatus == False
+            ott1.filledStatus = False
+            ott1.fill(m)
+            # ott1 should have been filled
+            self.assertIs(ott1.filledStatus, True)
+            self.assertEqual(len(ott1), 4)
+            for i, el in enumerate(ott1.getSpannedElements()):
+                self.assertIs(el, theNotes[i])
+
+        with self.subTest(scenario='Ottava with no elements'):
+            ott2 = spanner.Ottava()
+            ott2.fill(m)
+            self.assertEqual(len(ott2), 0)
+
+        with self.subTest(scenario='Ottava with only element not in searchStream'):
+            expectedElements = [note.Note('E')]
+            ott3 = spanner.Ottava(expectedElements)
+            ott3.fill(m)
+            self.assertEqual(len(ott3), 1)
+            self.assertIs(ott3.getFirst(), expectedElements[0])
+
+        with self.subTest(scenario='start element not in searchStream, end element is'):
+            expectedElements = [note.Note('F'), theNotes[0]]
+            ott4 = spanner.Ottava(expectedElements)
+            ott4.fill(m)
+            self.assertEqual(len(ott4), 2)
+            for i, el in enumerate(ott4.getSpannedElements()):
+                self.assertIs(el, expectedElements[i])
+
+        with self.subTest(scenario='end element not in searchStream, start element is'):
+            expectedElements = [theNotes[0], note.Note('G')]
+            ott5 = spanner.Ottava(expectedElements)
+            ott5.fill(m)
+            self.assertEqual(len(ott5), 2)
+            for i, el in enumerate(ott5.getSpannedElements()):
+                self.assertIs(el, expectedElements[i])
 
+    def testSpannerBundle(self):
         su1 = spanner.Slur()
         su1.idLocal = 1
         su2 = spanner.Slur()
@@ -176,15 +212,13 @@ class Test(unittest.TestCase):
         s = stream.Stream()
         s.append(su3)
         s.append(su4)
-        sb2 = spanner.SpannerBundle(list(s))
+        # .elements skips the StreamIterator that list(s) would run
+        sb2 = spanner.SpannerBundle(list(s.elements))
         self.assertEqual(len(sb2), 2)
         self.assertEqual(sb2[0], su3)
         self.assertEqual(sb2[1], su4)
 
     def testDeepcopySpanner(self):
-        from music21 import spanner
-        from music21 import note
-
         # how slurs might be defined
         n1 = note.Note()
         # n2 = note.Note()
@@ -201,8 +235,12 @@ class Test(unittest.TestCase):
         self.assertEqual(su1.getSpannedElements(), [n1, n3])
         self.assertEqual(su2.getSpannedElements(), [n1, n3])
 
-        self.assertEqual(n1.getSpannerSites(), [su1, su2])
-        self.assertEqual(n3.getSpannerSites(), [su1, su2])
+        # getSpannerSites() does not promise an order, so check membership
+        for n in (n1, n3):
+            spannerSites = n.getSpannerSites()
+            self.assertEqual(len(spannerSites), 2)
+            self.assertIn(su1, spannerSites)
+            self.assertIn(su2, spannerSites)
 
         sb1 = spanner.SpannerBundle([su1, su2])
         sb2 = copy.deepcopy(sb1)
@@ -212,9 +250,6 @@ class Test(unittest.TestCase):
         self.assertNotEqual(id(sb2[0]), id(sb1[0]))
 
     def testReplaceSpannedElement(self):
-        from music21 import note
-        from music21 import spanner
-
         n1 = note.Note()
         n2 = note.Note()
         n3 = note.Note()
@@ -272,9 +307,6 @@ class Test(unittest.TestCase):
         self.assertEqual(sb1[2].getSpannedElements(), [n4a, n5])
 
     def testRepeatBracketA(self):
-        from music21 import spanner
-        from music21 import stream
-
         m1 = stream.Measure()
         rb1 = spanner.RepeatBracket(m1)
         # if added again; it is not really added, it simply is ignored
@@ -282,11 +314,6 @@ class Test(unittest.TestCase):
         self.assertEqual(len(rb1), 1)
 
     def testRepeatBracketB(self):
-        from music21 import note
-        from music21 import spanner
-        from music21 import stream
-        from music21 import bar
-
         p = stream.Part()
         m1 = stream.Measure()
         m1.repeatAppend(note.Note('c4'), 4)
@@ -320,40 +347,18 @@ class Test(unittest.TestCase):
         # all spanners should be at the part level
         self.assertEqual(len(p.spanners), 3)
 
-    # noinspection DuplicatedCode
     def testRepeatBracketC(self):
-        from music21 import note
-        from music21 import spanner
-        from music21 import stream
-        from music21 import bar
+        p = copy.deepcopy(self._repeatPart)
+        unused_m1, m2, m3, m4, m5 = p.getElementsByClass(stream.Measure)
 
-        p = stream.Part()
-        m1 = stream.Measure()
-        m1.repeatAppend(note.Note('c4'), 4)
-        p.append(m1)
-
-        m2 = stream.Measure()
-        m2.repeatAppend(note.Note('d#4'), 4)
-        p.append(m2)
-
-        m3 = stream.Measure()
-        m3.repeatAppend(note.Note('g#4'), 4)
         m3.rightBarline = bar.Repeat(direction='end')
-        p.append(m3)
         rb1 = spanner.RepeatBracket(number=1)
         rb1.addSpannedElements(m2, m3)
         self.assertEqual(len(rb1), 2)
         p.insert(0, rb1)
 
-        m4 = stream.Measure()
-        m4.repeatAppend(note.Note('a4'), 4)
         m4.rightBarline = bar.Repeat(direction='end')
-        p.append(m4)
-        p.append(spanner.RepeatBracket(m4, number=2))
-
-        m5 = stream.Measure()
-        m5.repeatAppend(note.Note('b4'), 4)
-        p.append(m5)
+        p.insert(m5.offset, spanner.RepeatBracket(m4, number=2))
 
         # p.show()
         # all spanners should be at the part level
@@ -361,84 +366,41 @@ class Test(unittest.TestCase):
 
         # p.show()
         raw = self.xmlStr(p)
-        self.assertGreater(raw.find('''<ending number="1" type="start" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="stop" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="start" />'''), 1)
+        endings = _endings(raw)
+        self.assertIn(('1', 'start'), endings)
+        self.assertIn(('2', 'stop'), endings)
+        self.assertIn(('2', 'start'), endings)
 
-    # noinspection DuplicatedCode
     def testRepeatBracketD(self):
-        from music21 import note
-        from music21 import spanner
-        from music21 import stream
-        from music21 import bar
-
-        p = stream.Part()
-        m1 = stream.Measure()
-        m1.repeatAppend(note.Note('c4'), 4)
-        p.append(m1)
-
-        m2 = stream.Measure()
-        m2.repeatAppend(note.Note('d#4'), 4)
-        p.append(m2)
+        p = copy.deepcopy(self._repeatPart)
+        # repeatAppend deepcopies what it is given, so one Note per pitch serves
+        templates = {'a4': note.Note('a4'), 'b4': note.Note('b4')}
+        for pitchName in ('a4', 'b4', 'a4', 'a4', 'b4', 'a4', 'a4'):
+            m = stream.Measure()
+            m.repeatAppend(templates[pitchName], 4)
+            p.append(m)
+        (unused_m1, m2, m3, m4, m5, m6, unused_m7, m8,
+         m9, m10, m11, m12) = p.getElementsByClass(stream.Measure)
 
-        m3 = stream.Measure()
-        m3.repeatAppend(note.Note('g#4'), 4)
         m3.rightBarline = bar.Repeat(direction='end')
-        p.append(m3)
         rb1 = spanner.RepeatBracket(number=1)
         rb1.addSpannedElements(m2, m3)
         self.assertEqual(len(rb1), 2)
         p.insert(0, rb1)
 
-        m4 = stream.Measure()
-        m4.repeatAppend(note.Note('a4'), 4)
-        p.append(m4)
-
-        m5 = stream.Measure()
-        m5.repeatAppend(note.Note('b4'), 4)
         m5.rightBarline = bar.Repeat(direction='end')
-        p.append(m5)
-
         rb2 = spanner.RepeatBracket(number=2)
         rb2.addSpannedElements(m4, m5)
         self.assertEqual(len(rb2), 2)
         p.insert(0, rb2)
 
-        m6 = stream.Measure()
-        m6.repeatAppend(note.Note('a4'), 4)
-        p.append(m6)
-
-        m7 = stream.Measure()
-        m7.repeatAppend(note.Note('b4'), 4)
-        p.append(m7)
-
-        m8 = stream.Measure()
-        m8.repeatAppend(note.Note('a4'), 4)
         m8.rightBarline = bar.Repeat(direction='end')
-        p.append(m8)
-
         rb3 = spanner.RepeatBracket(number=3)
         rb3.addSpannedElements(m6, m8)
         self.assertEqual(len(rb3), 2)
         p.insert(0, rb3)
 
-        m9 = stream.Measure()
-        m9.repeatAppend(note.Note('a4'), 4)
-        p.append(m9)
-
-        m10 = stream.Measure()
-        m10.repeatAppend(note.Note('b4'), 4)
-        p.append(m10)
-
-        m11 = stream.Measure()
-        m11.repeatAppend(note.Note('a4'), 4)
-        p.append(m11)
-
-        m12 = stream.Measure()
-        m12.repeatAppend(note.Note('a4'), 4)
         m12.rightBarline = bar.Repeat(direction='end')
-        p.append(m12)
-
         rb4 = spanner.RepeatBracket(number=4)
         rb4.addSpannedElements(m9, m10, m11, m12)
         self.assertEqual(len(rb4), 4)
@@ -450,28 +412,22 @@ class Test(unittest.TestCase):
         self.assertEqual(len(p.spanners), 4)
 
         raw = self.xmlStr(p)
-        self.assertGreater(raw.find('''<ending number="1" type="start" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="stop" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="start" />'''), 1)
-
-        p1 = copy.deepcopy(p)
-        raw = self.xmlStr(p1)
-        self.assertGreater(raw.find('''<ending number="1" type="start" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="stop" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="start" />'''), 1)
-
-        p2 = copy.deepcopy(p1)
-        raw = self.xmlStr(p2)
-        self.assertGreater(raw.find('''<ending number="1" type="start" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="stop" />'''), 1)
-        self.assertGreater(raw.find('''<ending number="2" type="start" />'''), 1)
+        endings = _endings(raw)
+        self.assertIn(('1', 'start'), endings)
+        self.assertIn(('2', 'stop'), endings)
+        self.assertIn(('2', 'start'), endings)
+
+        # a copy, then a copy of that copy
+        pCopy = p
+        for unused_i in range(2):
+            pCopy = copy.deepcopy(pCopy)
+            raw = self.xmlStr(pCopy)
+            endings = _endings(raw)
+            self.assertIn(('1', 'start'), endings)
+            self.assertIn(('2', 'stop'), endings)
+            self.assertIn(('2', 'start'), endings)
 
     def testRepeatBracketE(self):
-        from music21 import note
-        from music21 import spanner
-        from music21 import stream
-        from music21 import bar
-
         p = stream.Part()
         m1 = stream.Measure(number=1)
         m1.repeatAppend(note.Note('c4'), 1)
@@ -505,39 +461,25 @@ class Test(unittest.TestCase):
         # all spanners should be at the part level
         self.assertEqual(len(p.spanners), 3)
 
-        # try copying once
-        p1 = copy.deepcopy(p)
-        self.assertEqual(len(p1.spanners), 3)
-        m5 = p1.getElementsByClass(stream.Measure)[-2]
-        sp3 = p1.spanners[2]
-        self.assertTrue(sp3.hasSpannedElement(m5))
-        # for m in p1.getElementsByClass(stream.Measure):
-        #     print(m, id(m))
-        # for sp in p1.spanners:
-        #     print(sp, id(sp), [c for c in sp.getSpannedElementIds()])
-        # p1.show()
-
-        p2 = copy.deepcopy(p1)
-        self.assertEqual(len(p2.spanners), 3)
-        m5 = p2.getElementsByClass(stream.Measure)[-2]
-        sp3 = p2.spanners[2]
-        self.assertTrue(sp3.hasSpannedElement(m5))
-
-        p3 = copy.deepcopy(p2)
-        self.assertEqual(len(p3.spanners), 3)
-        m5 = p3.getElementsByClass(stream.Measure)[-2]
-        sp3 = p3.spanners[2]
-        self.assertTrue(sp3.hasSpannedElement(m5))
+        # try copying once, then copying the copy
+        pCopy = p
+        for unused_i in range(2):
+            pCopy = copy.deepcopy(pCopy)
+            self.assertEqual(len(pCopy.spanners), 3)
+            m5 = pCopy.getElementsByClass(stream.Measure)[-2]
+            sp3 = pCopy.spanners[2]
+            self.assertTrue(sp3.hasSpannedElement(m5))
+            # for m in pCopy.getElementsByClass(stream.Measure):
+            #     print(m, id(m))
+            # for sp in pCopy.spanners:
+            #     print(sp, id(sp), [c for c in sp.getSpannedElementIds()])
+            # pCopy.show()
 
     def testOttavaShiftA(self):
         '''
         Test basic octave shift creation and output, as well as passing
         objects through make measure calls.
         '''
-        from music21 import stream
-        from music21 import note
-        from music21 import chord
-        from music21.spanner import Ottava   # need to do it this way for classSet
         s = stream.Stream()
         s.repeatAppend(chord.Chord(['c-3', 'g4']), 12)
         # s.repeatAppend(note.Note(), 12)
@@ -550,46 +492,25 @@ class Test(unittest.TestCase):
         self.assertEqual(raw.count('type="down"'), 1)
         # s.show()
 
-        s = stream.Stream()
-        s.repeatAppend(note.Note(), 12)
-        n1 = s.notes[0]
-        n2 = s.notes[-1]
-        sp1 = Ottava(n1, n2, type='8vb')
-        s.append(sp1)
-        # s.show()
-        raw = self.xmlStr(s)
-        self.assertEqual(raw.count('octave-shift'), 2)
-        self.assertEqual(raw.count('type="up"'), 1)
-
-        s = stream.Stream()
-        s.repeatAppend(note.Note(), 12)
-        n1 = s.notes[0]
-        n2 = s.notes[-1]
-        sp1 = Ottava(n1, n2, type='15ma')
-        s.append(sp1)
-        # s.show()
-        raw = self.xmlStr(s)
-        self.assertEqual(raw.count('octave-shift'), 2)
-        self.assertEqual(raw.count('type="down"'), 1)
-
-        s = stream.Stream()
-        s.repeatAppend(note.Note(), 12)
-        n1 = s.notes[0]
-        n2 = s.notes[-1]
-        sp1 = Ottava(n1, n2, type='15mb')
-        s.append(sp1)
-        # s.show()
-        raw = self.xmlStr(s)
-        self.assertEqual(raw.count('octave-shift'), 2)
-        self.assertEqual(raw.count('type="up"'), 1)
+        # the other types on a stream of notes, each on its own copy
+        noteStream = stream.Stream()
+        noteStream.repeatAppend(note.Note(), 12)
+        for ottavaType, shiftType in (('8vb', 'up'), ('15ma', 'down'), ('15mb', 'up')):
+            with self.subTest(ottavaType=ottavaType):
+                s = copy.deepcopy(noteStream)
+                n1 = s.notes[0]
+                n2 = s.notes[-1]
+                sp1 = Ottava(n1, n2, type=ottavaType)
+                s.append(sp1)
+                # s.show()
+                raw = self.xmlStr(s)
+                self.assertEqual(raw.count('octave-shift'), 2)
+                self.assertEqual(raw.count(f'type="{shiftType}"'), 1)
 
     def testOttavaShiftB(self):
         '''
         Test a single note octave
         '''
-        from music21 import stream
-        from music21 import note
-        from music21 import spanner
         s = stream.Stream()
         n = note.Note('c4')
         sp = spanner.Ottava(n)
@@ -601,9 +522,6 @@ class Test(unittest.TestCase):
         self.assertEqual(raw.count('type="down"'), 1)
 
     def testCrescendoA(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import dynamics
         s = stream.Stream()
         # n1 = note.Note('C')
         # n2 = note.Note('D')
@@ -617,13 +535,14 @@ class Test(unittest.TestCase):
 
         # s.repeatAppend(chord.Chord(['c-3', 'g4']), 12)
         s.repeatAppend(note.Note(type='half'), 4)
-        n1 = s.notes[0]
+        notes = list(s.notes)
+        n1 = notes[0]
         n1.pitch.step = 'D'
         # s.insert(n1.offset, dynamics.Dynamic('fff'))
-        n2 = s.notes[len(s.notes) // 2]
+        n2 = notes[len(notes) // 2]
         n2.pitch.step = 'E'
         # s.insert(n2.offset, dynamics.Dynamic('ppp'))
-        n3 = s.notes[-1]
+        n3 = notes[-1]
         n3.pitch.step = 'F'
         # s.insert(n3.offset, dynamics.Dynamic('ff'))
         sp1 = dynamics.Diminuendo(n1, n2)
@@ -639,15 +558,12 @@ class Test(unittest.TestCase):
         # self.assertEqual(raw.count('octave-shift'), 2)
 
     def testLineA(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import spanner
-
         s = stream.Stream()
         s.repeatAppend(note.Note(), 12)
-        n1 = s.notes[0]
-        n2 = s.notes[len(s.notes) // 2]
-        n3 = s.notes[-1]
+        notes = list(s.notes)
+        n1 = notes[0]
+        n2 = notes[len(notes) // 2]
+        n3 = notes[-1]
         sp1 = spanner.Line(n1, n2, startTick='up', lineType='dotted')
         sp2 = spanner.Line(n2, n3, startTick='down', lineType='dashed',
                                     endHeight=40)
@@ -659,17 +575,14 @@ class Test(unittest.TestCase):
         self.assertEqual(raw.count('<bracket'), 4)
 
     def testLineB(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import spanner
-
         s = stream.Stream()
         s.repeatAppend(note.Note(), 12)
-        n1 = s.notes[4]
-        n2 = s.notes[-1]
+        notes = list(s.notes)
+        n1 = notes[4]
+        n2 = notes[-1]
 
-        n3 = s.notes[0]
-        n4 = s.notes[2]
+        n3 = notes[0]
+        n4 = notes[2]
 
         sp1 = spanner.Line(n1, n2, startTick='up', endTick='down', lineType='solid')
         sp2 = spanner.Line(n3, n4, startTick='arrow', endTick='none', lineType='solid')
@@ -679,26 +592,25 @@ class Test(unittest.TestCase):
 
         # s.show()
         raw = self.xmlStr(s)
-        self.assertEqual(raw.count('<bracket'), 4)
-        self.assertEqual(raw.count('line-end="arrow"'), 1)
-        self.assertEqual(raw.count('line-end="none"'), 1)
-        self.assertEqual(raw.count('line-end="up"'), 1)
-        self.assertEqual(raw.count('line-end="down"'), 1)
+        counts = _snippetCounts(raw, '<bracket', 'line-end="arrow"', 'line-end="none"',
+                                'line-end="up"', 'line-end="down"')
+        self.assertEqual(counts['<bracket'], 4)
+        self.assertEqual(counts['line-end="arrow"'], 1)
+        self.assertEqual(counts['line-end="none"'], 1)
+        self.assertEqual(counts['line-end="up"'], 1)
+        self.assertEqual(counts['line-end="down"'], 1)
 
     def testGlissandoA(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import spanner
-
         s = stream.Stream()
         s.repeatAppend(note.Note(), 3)
-        for i, n in enumerate(s.notes):
-            n.transpose(i + (i % 2 * 12), inPlace=True)
+        notes = list(s.notes)
+        for n, steps in zip(notes, _GLISSANDO_STEPS):
+            n.transpose(steps, inPlace=True)
 
         # note: this does not support glissandi between non-adjacent notes
-        n1 = s.notes[0]
-        n2 = s.notes[len(s.notes) // 2]
-        n3 = s.notes[-1]
+        n1 = notes[0]
+        n2 = notes[len(notes) // 2]
+        n3 = notes[-1]
         sp1 = spanner.Glissando(n1, n2)
         sp2 = spanner.Glissando(n2, n3)
         sp2.lineType = 'dashed'
@@ -708,22 +620,20 @@ class Test(unittest.TestCase):
         # s.show('t')
         raw = self.xmlStr(s)
         # print(raw)
-        self.assertEqual(raw.count('<glissando'), 4)
-        self.assertEqual(raw.count('line-type="dashed"'), 2)
+        counts = _snippetCounts(raw, '<glissando', 'line-type="dashed"')
+        self.assertEqual(counts['<glissando'], 4)
+        self.assertEqual(counts['line-type="dashed"'], 2)
 
     def testGlissandoB(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import spanner
-
         s = stream.Stream()
         s.repeatAppend(note.Note(), 12)
-        for i, n in enumerate(s.notes):
-            n.transpose(i + (i % 2 * 12), inPlace=True)
+        notes = list(s.notes)
+        for n, steps in zip(notes, _GLISSANDO_STEPS):
+            n.transpose(steps, inPlace=True)
 
         # note: this does not support glissandi between non-adjacent notes
-        n1 = s.notes[0]
-        n2 = s.notes[1]
+        n1 = notes[0]
+        n2 = notes[1]
         sp1 = spanner.Glissando(n1, n2)
         sp1.lineType = 'solid'
         sp1.label = 'gliss.'
@@ -731,9 +641,10 @@ class Test(unittest.TestCase):
 
         # s.show()
         raw = self.xmlStr(s)
-        self.assertEqual(raw.count('<glissando'), 2)
-        self.assertEqual(raw.count('line-type="solid"'), 2)
-        self.assertEqual(raw.count('>gliss.<'), 1)
+        counts = _snippetCounts(raw, '<glissando', 'line-type="solid"', '>gliss.<')
+        self.assertEqual(counts['<glissando'], 2)
+        self.assertEqual(counts['line-type="solid"'], 2)
+        self.assertEqual(counts['>gliss.<'], 1)
 
     # def testDashedLineA(self):
     #     from music21 import stream, note, spanner, chord, dynamics
@@ -754,9 +665,6 @@ class Test(unittest.TestCase):
     #     self.assertEqual(raw.count('<dashes'), 4)
 
     def testOneElementSpanners(self):
-        from music21 import note
-        from music21.spanner import Spanner
-
         n1 = note.Note()
         sp = Spanner()
         sp.addSpannedElements(n1)
@@ -766,10 +674,6 @@ class Test(unittest.TestCase):
         self.assertTrue(sp.isLast(n1))
 
     def testRemoveSpanners(self):
-        from music21 import stream
-        from music21 import note
-        from music21.spanner import Spanner, Slur
-
         p = stream.Part()
         m1 = stream.Measure()
         m2 = stream.Measure()
@@ -789,11 +693,6 @@ class Test(unittest.TestCase):
         self.assertEqual(len(p.spanners), 0)
 
     def testFreezeSpanners(self):
-        from music21 import stream
-        from music21 import note
-        from music21 import converter
-        from music21.spanner import Slur
-
         p = stream.Part()
         m1 = stream.Measure()
         m2 = stream.Measure()
@@ -809,77 +708,56 @@ class Test(unittest.TestCase):
         p.insert(0, sl)
         unused_data = converter.freezeStr(p, fmt='pickle')
 
-    def testDeepcopyJustSpannerAndNotes(self):
-        from music21 import note
-        from music21 import clef
-        from music21.spanner import Spanner
-
-        n1 = note.Note('g')
-        n2 = note.Note('f#')
-        c1 = clef.AltoClef()
-
-        sp1 = Spanner(n1, n2, c1)
-        sp2 = copy.deepcopy(sp1)
-        self.assertEqual(len(sp2.spannerStorage), 3)
-        self.assertIsNot(sp1, sp2)
-        self.assertIs(sp2[0], sp1[0])
-        self.assertIs(sp2[2], sp1[2])
-        self.assertIs(sp1[0], n1)
-        self.assertIs(sp2[0], n1)
-
-    def testDeepcopySpannerInStreamNotNotes(self):
-        from music21 import note
-        from music21 import clef
-        from music21 import stream
-        from music21.spanner import Spanner
-
-        n1 = note.Note('g')
-        n2 = note.Note('f#')
-        c1 = clef.AltoClef()
-
-        sp1 = Spanner(n1, n2, c1)
-        st1 = stream.Stream()
-        st1.insert(0.0, sp1)
-        st2 = copy.deepcopy(st1)
-
-        sp2 = st2.spanners[0]
-        self.assertEqual(len(sp2.spannerStorage), 3)
-        self.assertIsNot(sp1, sp2)
-        self.assertIs(sp2[0], sp1[0])
-        self.assertIs(sp2[2], sp1[2])
-        self.assertIs(sp1[0], n1)
-        self.assertIs(sp2[0], n1)
-
-    def testDeepcopyNotesInStreamNotSpanner(self):
-        from music21 import note
-        from music21 import clef
-        from music21 import stream
-        from music21.spanner import Spanner
-
-        n1 = note.Note('g')
-        n2 = note.Note('f#')
-        c1 = clef.AltoClef()
-
-        sp1 = Spanner(n1, n2, c1)
-        st1 = stream.Stream()
-        st1.insert(0.0, n1)
-        st1.insert(1.0, n2)
-        st2 = copy.deepcopy(st1)
-
-        n3 = st2.notes[0]
-        self.assertEqual(len(n3.getSpannerSites()), 1)
-        sp2 = n3.getSpannerSites()[0]
-        self.assertIs(sp1, sp2)
-        self.assertIsNot(n1, n3)
-        self.assertIs(sp2[2], sp1[2])
-        self.assertIs(sp1[0], n1)
-        self.assertIs(sp2[0], n1)
+    def testDeepcopySpannerWithClef(self):
+        def spannerWithClef():
+            # a deepcopy leaves its spanner sites on the original notes, so every
+            # scenario starts from its own notes rather than sharing one set
+            n1 = note.Note('g')
+            n2 = note.Note('f#')
+            c1 = clef.AltoClef()
+            return n1, n2, Spanner(n1, n2, c1)
+
+        with self.subTest(scenario='just spanner and notes'):
+            n1, unused_n2, sp1 = spannerWithClef()
+            sp2 = copy.deepcopy(sp1)
+            self.assertEqual(len(sp2.spannerStorage), 3)
+            self.assertIsNot(sp1, sp2)
+            self.assertIs(sp2[0], sp1[0])
+            self.assertIs(sp2[2], sp1[2])
+            self.assertIs(sp1[0], n1)
+            self.assertIs(sp2[0], n1)
+
+        with self.subTest(scenario='spanner in stream, not notes'):
+            n1, unused_n2, sp1 = spannerWithClef()
+            st1 = stream.Stream()
+            st1.insert(0.0, sp1)
+            st2 = copy.deepcopy(st1)
+
+            sp2 = st2.spanners[0]
+            self.assertEqual(len(sp2.spannerStorage), 3)
+            self.assertIsNot(sp1, sp2)
+            self.assertIs(sp2[0], sp1[0])
+            self.assertIs(sp2[2], sp1[2])
+            self.assertIs(sp1[0], n1)
+            self.assertIs(sp2[0], n1)
+
+        with self.subTest(scenario='notes in stream, not spanner'):
+            n1, n2, sp1 = spannerWithClef()
+            st1 = stream.Stream()
+            st1.insert(0.0, n1)
+            st1.insert(1.0, n2)
+            st2 = copy.deepcopy(st1)
+
+            n3 = st2.notes[0]
+            self.assertEqual(len(n3.getSpannerSites()), 1)
+            sp2 = n3.getSpannerSites()[0]
+            self.assertIs(sp1, sp2)
+            self.assertIsNot(n1, n3)
+            self.assertIs(sp2[2], sp1[2])
+            self.assertIs(sp1[0], n1)
+            self.assertIs(sp2[0], n1)
 
     def testDeepcopyNotesAndSpannerInStream(self):
-        from music21 import note
-        from music21 import stream
-        from music21.spanner import Spanner
-
         n1 = note.Note('G4')
         n2 = note.Note('F#4')
 
@@ -901,10 +779,6 @@ class Test(unittest.TestCase):
         self.assertIs(sp2[0], n3)
 
     def testDeepcopyStreamWithSpanners(self):
-        from music21 import note
-        from music21 import stream
-        from music21.spanner import Slur
-
         n1 = note.Note()
         su1 = Slur((n1,))
         s = stream.Stream()
@@ -926,9 +800,6 @@ class Test(unittest.TestCase):
         self.assertEqual(len(tn2), 1)
 
     def testGetSpannedElementIds(self):
-        from music21 import note
-        from music21.spanner import Spanner
-
         n1 = note.Note('g')
         n2 = note.Note('f#')
         n3 = note.Note('e')
@@ -939,28 +810,36 @@ class Test(unittest.TestCase):
         sl.addSpannedElements(n1)
         sl.addSpannedElements(n2, n3)
         sl.addSpannedElements([n4, n5])
-        idList = [id(n) for n in [n1, n2, n3, n4, n5]]
-        slList = sl.getSpannedElementIds()
-        self.assertEqual(idList, slList)
+        self.assertTupleEqual(tuple(sl.getSpannedElementIds()),
+                              tuple(map(id, (n1, n2, n3, n4, n5))))
+
+        # a long spanner keeps every element, in order
+        manyNotes = [note.Note() for unused_i in range(1000)]
+        sl = Spanner()
+        sl.addSpannedElements(manyNotes)
+        self.assertTupleEqual(tuple(sl.getSpannedElementIds()),
+                              tuple(map(id, manyNotes)))
 
     def testHammerOnPullOff(self):
-        from music21 import converter
         from music21.musicxml import testPrimitive
 
         s = converter.parse(testPrimitive.notations32a)
+        # one pass over the flat score, partitioned afterwards
+        found = list(s.flatten().getElementsByClass([articulations.HammerOn,
+                                                     articulations.PullOff]))
+        hammer_ons = [sp for sp in found if isinstance(sp, articulations.HammerOn)]
+        pull_offs = [sp for sp in found if isinstance(sp, articulations.PullOff)]
 
-        num_hammer_on = len(s.flatten().getElementsByClass('HammerOn'))
-        num_pull_off = len(s.flatten().getElementsByClass('PullOff'))
-        self.assertEqual(num_hammer_on, 1)
-        self.assertEqual(num_pull_off, 1)
+        self.assertEqual(len(hammer_ons), 1)
+        self.assertEqual(len(pull_offs), 1)
 
-        hammer_on = s.flatten().getElementsByClass('HammerOn')[0]
+        hammer_on = hammer_ons[0]
         hammer_n0 = hammer_on.getSpannedElements()[0]
         hammer_n1 = hammer_on.getSpannedElements()[1]
         self.assertEqual(hammer_n0.getSpannerSites()[0], hammer_on)
         self.assertEqual(hammer_n1.getSpannerSites()[0], hammer_on)
 
-        pull_off = s.flatten().getElementsByClass('PullOff')[0]
+        pull_off = pull_offs[0]
         pull_n0 = pull_off.getSpannedElements()[0]
         pull_n1 = pull_off.getSpannedElements()[1]
         self.assertEqual(pull_n0.getSpannerSites()[0], pull_off)
@@ -57,9 +57,7 @@ class Test(unittest.TestCase):
         p.insert(0, note.Note('C'))
         p.append(m)
         pRecurse = p.recurse(includeSelf=True)
-        allOffsets = []
-        for _ in pRecurse:
-            allOffsets.append(pRecurse.currentHierarchyOffset())
+        allOffsets = [pRecurse.currentHierarchyOffset() for _ in pRecurse]
         self.assertListEqual(allOffsets, [0.0, 0.0, 1.0, 1.0, 2.0])
         currentOffset = pRecurse.currentHierarchyOffset()
         self.assertIsNone(currentOffset)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+import copy
 import unittest
 
 from music21.stream.makeNotation import *
@@ -12,6 +13,12 @@ class Test(unittest.TestCase):
     '''
     allaBreveBeamTest = "tinyNotation: 2/2 c8 d e f   trip{a b c' a b c'}  f' e' d' G  a b c' d'"
 
+    @classmethod
+    def setUpClass(cls):
+        # parsed once; tests beam and set stems in place, so each takes a deepcopy
+        from music21 import converter
+        cls._allaBrevePart = converter.parse(cls.allaBreveBeamTest)
+
     def testNotesToVoices(self):
         from music21 import stream
         s = stream.Stream()
@@ -29,8 +36,7 @@ class Test(unittest.TestCase):
                          + '<music21.note.Note C>, <music21.note.Note C>]')
 
     def testSetStemDirectionOneGroup(self):
-        from music21 import converter
-        p = converter.parse(self.allaBreveBeamTest)
+        p = copy.deepcopy(self._allaBrevePart)
         p.makeBeams(inPlace=True, setStemDirections=False)
         a, b, c, d = iterateBeamGroups(p)
 
@@ -65,8 +71,7 @@ class Test(unittest.TestCase):
         testDirections(d, ['down', 'noStem', 'double', 'down'])
 
     def testSetStemDirectionForBeamGroups(self):
-        from music21 import converter
-        p = converter.parse(self.allaBreveBeamTest)
+        p = copy.deepcopy(self._allaBrevePart)
         p.makeBeams(inPlace=True, setStemDirections=False)
         d = list(iterateBeamGroups(p))[-1]
         dStems = ['down', 'noStem', 'double', 'up']
@@ -88,30 +93,33 @@ class Test(unittest.TestCase):
         from music21 import converter
         p = converter.parse('tinyNotation: 2/4 b8 f8 a8 b8')
         p.makeBeams(inPlace=True)
+        # setting stems changes the notes, not which notes there are
+        notes = list(p.flatten().notes)
         self.assertEqual(
-            [n.stemDirection for n in p.flatten().notes],
+            [n.stemDirection for n in notes],
             ['up', 'up', 'up', 'up']
         )
 
         # make manual changes
         dStems = ['down', 'unspecified', 'down', 'down']
-        for n, stemDir in zip(p.flatten().notes, dStems):
+        for n, stemDir in zip(notes, dStems):
             n.stemDirection = stemDir
 
         setStemDirectionForBeamGroups(p, setNewStems=True, overrideConsistentStemDirections=False)
         self.assertEqual(
-            [n.stemDirection for n in p.flatten().notes],
+            [n.stemDirection for n in notes],
             ['up', 'up', 'down', 'down']
         )
 
     def testMakeBeamsWithStemDirection(self):
-        from music21 import converter
-        p = converter.parse(self.allaBreveBeamTest)
+        p = copy.deepcopy(self._allaBrevePart)
+        # makeBeams(inPlace=True) keeps the same note objects
+        notes = list(p.flatten().notes)
         dStems = ['down', 'noStem', 'double', 'up']
-        for i, n in enumerate(p.flatten().notes[-4:]):
-            n.stemDirection = dStems[i]
+        for n, stemDir in zip(notes[-4:], dStems):
+            n.stemDirection = stemDir
         p.makeBeams(inPlace=True)
-        self.assertEqual([n.stemDirection for n in p.flatten().notes],
+        self.assertEqual([n.stemDirection for n in notes],
                          ['up'] * 4 + ['down'] * 6 + ['up'] * 4
                          + ['down', 'noStem', 'double', 'down']
                          )
@@ -138,7 +146,7 @@ class Test(unittest.TestCase):
         from music21 import stream
 
         p = converter.parse('tinyNotation: 2/4 r2 d8 d8 d8 d8')
-        m2 = p[stream.Measure].last()
+        m1, m2 = p[stream.Measure]
         self.assertIsNone(m2.timeSignature)
         m2_n0 = m2.notes.first()
         self.assertEqual(len(m2_n0.beams.beamsList), 0)
@@ -146,16 +154,14 @@ class Test(unittest.TestCase):
         self.assertEqual(len(m2_n0.beams.beamsList), 1)
 
         # Failure if no TimeSignature in context
-        m1 = p[stream.Measure].first()
         m1.timeSignature = None
         msg = 'cannot process beams in a Measure without a time signature'
         with self.assertRaisesRegex(stream.StreamException, msg):
             m2.makeBeams(inPlace=True, failOnNoTimeSignature=True)
 
     def testStreamExceptions(self):
-        from music21 import converter
         from music21 import stream
-        p = converter.parse(self.allaBreveBeamTest)
+        p = copy.deepcopy(self._allaBrevePart)
         with self.assertRaises(stream.StreamException) as cm:
             p.makeMeasures(meterStream=duration.Duration())
         self.assertEqual(str(cm.exception),
@@ -4,6 +4,23 @@
 import unittest
 
 from music21.tempo import *
+from music21 import stream
+
+
+def _notes(*quarterLengths):
+    '''
+    New Notes of the given quarterLengths, to be added with a single Stream.append().
+    '''
+    return [note.Note(quarterLength=ql) for ql in quarterLengths]
+
+
+def _quarterMeasure():
+    '''
+    A new Measure of four quarter notes.
+    '''
+    m = stream.Measure()
+    m.append(_notes(1, 1, 1, 1))
+    return m
 
 
 class Test(unittest.TestCase):
@@ -38,9 +55,14 @@ class Test(unittest.TestCase):
 
     def testTempoTextStyle(self):
         from music21 import tempo
+
+        def styleOf(obj):
+            # (absoluteY, fontStyle) from a single .style lookup
+            st = obj.style
+            return st.absoluteY, st.fontStyle
+
         tm = tempo.TempoText('adagio')
-        self.assertEqual(tm.style.absoluteY, 45)
-        self.assertEqual(tm.style.fontStyle, 'bold')
+        self.assertEqual(styleOf(tm), (45, 'bold'))
         tm.style.absoluteY = 33
         self.assertEqual(tm.style.absoluteY, 33)
         tm.style.fontStyle = 'italic'
@@ -51,27 +73,23 @@ class Test(unittest.TestCase):
         self.assertEqual(tx, 'adagio')
         te1 = tm.getTextExpression()
         self.assertEqual(te1.content, 'adagio')
-        self.assertEqual(tm.style.absoluteY, 33)
-        self.assertEqual(tm.style.fontStyle, 'italic')
+        self.assertEqual(styleOf(tm), (33, 'italic'))
 
         # check that tm.setTextExpression sets tm.style to the te's style (if there is one),
         # and links the two styles
         te2 = expressions.TextExpression('andante')
         te2.style.absoluteY = 38
         te2.style.fontStyle = 'bolditalic'
-        self.assertEqual(te2.style.absoluteY, 38)
-        self.assertEqual(te2.style.fontStyle, 'bolditalic')
+        self.assertEqual(styleOf(te2), (38, 'bolditalic'))
         tm.setTextExpression(te2)
-        self.assertEqual(tm.style.absoluteY, 38)
-        self.assertEqual(tm.style.fontStyle, 'bolditalic')
+        self.assertEqual(styleOf(tm), (38, 'bolditalic'))
         self.assertIs(tm.style, te2.style)      # check for linked styles
 
         # check again that calling tm.getTextExpression/tm.text doesn't modify style
         tm.getTextExpression()
         tx = tm.text
         self.assertEqual(tx, 'andante')
-        self.assertEqual(tm.style.absoluteY, 38)
-        self.assertEqual(tm.style.fontStyle, 'bolditalic')
+        self.assertEqual(styleOf(tm), (38, 'bolditalic'))
 
         # check that tm.setTextExpression (to a textExpression with no
         # style) leaves tm.style in place and links the two styles.
@@ -79,16 +97,14 @@ class Test(unittest.TestCase):
         self.assertFalse(te3.hasStyleInformation)
         self.assertTrue(tm.hasStyleInformation)
         tm.setTextExpression(te3)
-        self.assertEqual(tm.style.absoluteY, 38)            # same as before
-        self.assertEqual(tm.style.fontStyle, 'bolditalic')  # same as before
+        self.assertEqual(styleOf(tm), (38, 'bolditalic'))  # same as before
         self.assertIs(tm.style, te2.style)      # check for linked styles
 
         # check again that calling tm.getTextExpression/tm.text doesn't modify style
         tm.getTextExpression()
         tx = tm.text
         self.assertEqual(tx, 'andante with no style')
-        self.assertEqual(tm.style.absoluteY, 38)
-        self.assertEqual(tm.style.fontStyle, 'bolditalic')
+        self.assertEqual(styleOf(tm), (38, 'bolditalic'))
 
         # check that tm.setTextExpression(te4) (with tm and te4 with no style) links the
         # two styles, with default style set in place.
@@ -97,8 +113,7 @@ class Test(unittest.TestCase):
         self.assertFalse(te4.hasStyleInformation)
         self.assertFalse(tm.hasStyleInformation)
         tm.setTextExpression(te4)
-        self.assertEqual(tm.style.absoluteY, 45)        # default
-        self.assertEqual(tm.style.fontStyle, 'bold')    # default
+        self.assertEqual(styleOf(tm), (45, 'bold'))  # default
         self.assertIs(tm.style, te4.style)      # check for linked styles
 
     def testMetronomeMarkA(self):
@@ -180,13 +195,10 @@ class Test(unittest.TestCase):
 
     def testGetPreviousMetronomeMarkA(self):
         from music21 import tempo
-        from music21 import stream
 
         # test getting basic metronome marks
         p = stream.Part()
-        m1 = stream.Measure()
-        m1.repeatAppend(note.Note(quarterLength=1), 4)
-        m2 = copy.deepcopy(m1)
+        m1, m2 = _quarterMeasure(), _quarterMeasure()
         mm1 = tempo.MetronomeMark(number=56, referent=0.25)
         m1.insert(0, mm1)
         mm2 = tempo.MetronomeMark(number=150, referent=0.5)
@@ -198,13 +210,10 @@ class Test(unittest.TestCase):
 
     def testGetPreviousMetronomeMarkB(self):
         from music21 import tempo
-        from music21 import stream
 
         # test using a tempo text, will return a default metronome mark if possible
         p = stream.Part()
-        m1 = stream.Measure()
-        m1.repeatAppend(note.Note(quarterLength=1), 4)
-        m2 = copy.deepcopy(m1)
+        m1, m2 = _quarterMeasure(), _quarterMeasure()
         mm1 = tempo.TempoText('slow')
         m1.insert(0, mm1)
         mm2 = tempo.MetronomeMark(number=150, referent=0.5)
@@ -216,14 +225,10 @@ class Test(unittest.TestCase):
 
     def testGetPreviousMetronomeMarkC(self):
         from music21 import tempo
-        from music21 import stream
 
         # test using a metric modulation
         p = stream.Part()
-        m1 = stream.Measure()
-        m1.repeatAppend(note.Note(quarterLength=1), 4)
-        m2 = copy.deepcopy(m1)
-        m3 = copy.deepcopy(m2)
+        m1, m2, m3 = _quarterMeasure(), _quarterMeasure(), _quarterMeasure()
 
         mm1 = tempo.MetronomeMark('slow')
         m1.insert(0, mm1)
@@ -246,13 +251,9 @@ class Test(unittest.TestCase):
         '''
         Test setting referents directly via context searches.
         '''
-        from music21 import stream
         from music21 import tempo
         p = stream.Part()
-        m1 = stream.Measure()
-        m1.repeatAppend(note.Note(quarterLength=1), 4)
-        m2 = copy.deepcopy(m1)
-        m3 = copy.deepcopy(m2)
+        m1, m2, m3 = _quarterMeasure(), _quarterMeasure(), _quarterMeasure()
 
         mm1 = tempo.MetronomeMark(number=92)
         m1.insert(0, mm1)
@@ -272,12 +273,10 @@ class Test(unittest.TestCase):
 
     def testSetReferentB(self):
         from music21 import tempo
-        from music21 import stream
         s = stream.Stream()
         mm1 = tempo.MetronomeMark(number=60)
         s.append(mm1)
-        s.repeatAppend(note.Note(quarterLength=1), 2)
-        s.repeatAppend(note.Note(quarterLength=0.5), 4)
+        s.append(_notes(1, 1, 0.5, 0.5, 0.5, 0.5))
 
         mmod1 = tempo.MetricModulation()
         mmod1.oldReferent = 0.5  # can use Duration objects
@@ -291,7 +290,7 @@ class Test(unittest.TestCase):
                          '<music21.tempo.MetronomeMark animato Quarter=120>')
 
         s.append(note.Note())
-        s.repeatAppend(note.Note(quarterLength=1.5), 2)
+        s.append(_notes(1.5, 1.5))
 
         mmod2 = tempo.MetricModulation()
         mmod2.oldReferent = 1.5
@@ -308,12 +307,10 @@ class Test(unittest.TestCase):
 
     def testSetReferentC(self):
         from music21 import tempo
-        from music21 import stream
         s = stream.Stream()
         mm1 = tempo.MetronomeMark(number=60)
         s.append(mm1)
-        s.repeatAppend(note.Note(quarterLength=1), 2)
-        s.repeatAppend(note.Note(quarterLength=0.5), 4)
+        s.append(_notes(1, 1, 0.5, 0.5, 0.5, 0.5))
 
         mmod1 = tempo.MetricModulation()
         s.append(mmod1)
@@ -326,7 +323,7 @@ class Test(unittest.TestCase):
                          '<music21.tempo.MetronomeMark larghetto Quarter=120>')
 
         s.append(note.Note())
-        s.repeatAppend(note.Note(quarterLength=1.5), 2)
+        s.append(_notes(1.5, 1.5))
 
         mmod2 = tempo.MetricModulation()
         s.append(mmod2)
@@ -342,12 +339,10 @@ class Test(unittest.TestCase):
 
     def testSetReferentD(self):
         from music21 import tempo
-        from music21 import stream
         s = stream.Stream()
         mm1 = tempo.MetronomeMark(number=60)
         s.append(mm1)
-        s.repeatAppend(note.Note(quarterLength=1), 2)
-        s.repeatAppend(note.Note(quarterLength=0.5), 4)
+        s.append(_notes(1, 1, 0.5, 0.5, 0.5, 0.5))
 
         mmod1 = tempo.MetricModulation()
         s.append(mmod1)
@@ -365,13 +360,10 @@ class Test(unittest.TestCase):
         # s.repeatAppend(note.Note(quarterLength=1.5), 2)
 
     def testSetReferentE(self):
-        from music21 import stream
-
         s = stream.Stream()
         mm1 = MetronomeMark(number=70)
         s.append(mm1)
-        s.repeatAppend(note.Note(quarterLength=1), 2)
-        s.repeatAppend(note.Note(quarterLength=0.5), 4)
+        s.append(_notes(1, 1, 0.5, 0.5, 0.5, 0.5))
 
         mmod1 = MetricModulation()
         mmod1.oldReferent = 'eighth'
@@ -383,8 +375,7 @@ class Test(unittest.TestCase):
         s = stream.Stream()
         mm1 = MetronomeMark(number=70)
         s.append(mm1)
-        s.repeatAppend(note.Note(quarterLength=1), 2)
-        s.repeatAppend(note.Note(quarterLength=0.5), 4)
+        s.append(_notes(1, 1, 0.5, 0.5, 0.5, 0.5))
 
         # make sure it works in reverse too
         mmod1 = MetricModulation()
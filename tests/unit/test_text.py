@@ -19,6 +19,9 @@ class Test(unittest.TestCase):
         a = converter.parse(corpus.getWork('luca/gloria'))
         post = assembleLyrics(a)
         self.assertTrue(post.startswith('Et in terra pax hominibus bone voluntatis'))
+        # the opening phrase is sung by the first part within the first ten measures
+        post = assembleLyrics(a.parts[0].measures(1, 10))
+        self.assertTrue(post.startswith('Et in terra pax hominibus bone voluntatis'))
 
 
     def testAssembleLyricsA(self):
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+import bisect
+import operator
 import unittest
 
 from music21.tree.timespanTree import *
 
 
+_timespanKey = operator.attrgetter('offset', 'endTime')
+
+
 class Test(unittest.TestCase):
 
     def testGetVerticalityAtWithKey(self):
@@ -26,55 +31,42 @@ class Test(unittest.TestCase):
             stops = list(range(20))
             random.shuffle(starts)
             random.shuffle(stops)
-            tss = []
-            for start, stop in zip(starts, stops):
-                if start <= stop:
-                    tss.append(spans.Timespan(start, stop))
-                else:
-                    tss.append(spans.Timespan(stop, start))
+            tss = [spans.Timespan(min(start, stop), max(start, stop))
+                   for start, stop in zip(starts, stops)]
             tsTree = TimespanTree()
 
-            for i, timespan in enumerate(tss):
+            # kept sorted as the tree grows and shrinks, instead of re-sorting each step
+            currentTimespansInList = []
+            for timespan in tss:
                 tsTree.insert(timespan)
-                currentTimespansInList = list(sorted(tss[:i + 1],
-                                                     key=lambda x: (x.offset, x.endTime)))
+                bisect.insort(currentTimespansInList, timespan, key=_timespanKey)
                 currentTimespansInTree = list(tsTree)
-                currentPosition = min(x.offset for x in currentTimespansInList)
-                currentEndTime = max(x.endTime for x in currentTimespansInList)
+                endTimes = [x.endTime for x in currentTimespansInList]
 
                 self.assertEqual(currentTimespansInTree,
                                  currentTimespansInList,
                                  (attempt, currentTimespansInTree, currentTimespansInList))
-                self.assertEqual(tsTree.rootNode.endTimeLow,
-                                 min(x.endTime for x in currentTimespansInList))
-                self.assertEqual(tsTree.rootNode.endTimeHigh,
-                                 max(x.endTime for x in currentTimespansInList))
-                self.assertEqual(tsTree.lowestPosition(), currentPosition)
-                self.assertEqual(tsTree.endTime, currentEndTime)
-                for inList, inTree in zip(currentTimespansInList, currentTimespansInTree):
-                    self.assertEqual(inList, inTree)
+                self.assertEqual(tsTree.rootNode.endTimeLow, min(endTimes))
+                self.assertEqual(tsTree.rootNode.endTimeHigh, max(endTimes))
+                self.assertEqual(tsTree.lowestPosition(), currentTimespansInList[0].offset)
+                self.assertEqual(tsTree.endTime, max(endTimes))
 
             random.shuffle(tss)
             while tss:
                 timespan = tss.pop()
-                currentTimespansInList = sorted(tss,
-                                                key=lambda x: (x.offset, x.endTime))
+                currentTimespansInList.remove(timespan)
                 tsTree.removeTimespan(timespan)
                 currentTimespansInTree = list(tsTree)
                 self.assertEqual(currentTimespansInTree,
                                  currentTimespansInList,
                                  (attempt, currentTimespansInTree, currentTimespansInList))
                 if tsTree.rootNode is not None:
-                    currentPosition = min(x.offset for x in currentTimespansInList)
-                    currentEndTime = max(x.endTime for x in currentTimespansInList)
-                    self.assertEqual(tsTree.rootNode.endTimeLow,
-                                     min(x.endTime for x in currentTimespansInList))
-                    self.assertEqual(tsTree.rootNode.endTimeHigh,
-                                     max(x.endTime for x in currentTimespansInList))
-                    self.assertEqual(tsTree.lowestPosition(), currentPosition)
-                    self.assertEqual(tsTree.endTime, currentEndTime)
-                    for inList, inTree in zip(currentTimespansInList, currentTimespansInTree):
-                        self.assertEqual(inList, inTree)
+                    endTimes = [x.endTime for x in currentTimespansInList]
+                    self.assertEqual(tsTree.rootNode.endTimeLow, min(endTimes))
+                    self.assertEqual(tsTree.rootNode.endTimeHigh, max(endTimes))
+                    self.assertEqual(tsTree.lowestPosition(),
+                                     currentTimespansInList[0].offset)
+                    self.assertEqual(tsTree.endTime, max(endTimes))
 
 
 if __name__ == '__main__':
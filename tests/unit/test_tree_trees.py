@@ -20,14 +20,17 @@ class Test(unittest.TestCase):
 
         s = stream.Stream()
         for i in range(100):
-            n = note.Note()
-            n.duration.quarterLength = 2.0
-            s.insert(i * 2, n)
+            s.insert(i * 2, note.Note(quarterLength=2.0))
 
         for n in s:
             et.insert(n)
         self.assertTrue(repr(et).startswith('<ElementTree {100} (0.0 <0.20'))
 
+        # a bulk insert of the same notes builds the same tree
+        etBulk = ElementTree()
+        etBulk.insert(list(s))
+        self.assertEqual(repr(etBulk), repr(et))
+
         n2 = s[-1]
 
         self.assertEqual(et.index(n2, n2.sortTuple()), 99)
@@ -12,12 +12,7 @@ class Test(unittest.TestCase):
         testCopyAll(self, globals())
 
     def pitchOut(self, listIn):
-        out = '['
-        for p in listIn:
-            out += str(p) + ', '
-        out = out[0:len(out) - 2]
-        out += ']'
-        return out
+        return '[' + ', '.join(str(p) for p in listIn) + ']'
 
     def testBasicA(self):
         o = Variant()
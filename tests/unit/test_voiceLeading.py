@@ -35,7 +35,9 @@ class Test(unittest.TestCase):
         assert a.antiParallelMotion() is False
         assert a.obliqueMotion() is False
         assert a.parallelInterval(interval.Interval('P5')) is True
+        assert a.parallelInterval('P5') is True
         assert a.parallelInterval(interval.Interval('M3')) is False
+        assert a.parallelInterval('M3') is False
 
         b = VoiceLeadingQuartet(c4, c4, g4, g4)
         assert b.noMotion() is True
@@ -46,11 +48,15 @@ class Test(unittest.TestCase):
         c = VoiceLeadingQuartet(c4, g4, c5, g4)
         assert c.antiParallelMotion() is True
         assert c.hiddenInterval(interval.Interval('P5')) is False
+        assert c.hiddenInterval('P5') is False
 
         d = VoiceLeadingQuartet(c4, d4, e4, a4)
         assert d.hiddenInterval(interval.Interval('P5')) is True
+        assert d.hiddenInterval('P5') is True
         assert d.hiddenInterval(interval.Interval('A4')) is False
+        assert d.hiddenInterval('A4') is False
         assert d.hiddenInterval(interval.Interval('AA4')) is False
+        assert d.hiddenInterval('AA4') is False
 
 
 class TestExternal(unittest.TestCase):
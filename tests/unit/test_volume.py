@@ -1,17 +1,19 @@
 # -*- coding: utf-8 -*-
 # Migrated from embedded tests
 
+import copy
+import gc
 import unittest
 
 from music21.volume import *
+from music21 import corpus
+from music21 import stream
+from music21 import volume
 
 
 class Test(unittest.TestCase):
 
     def testBasic(self):
-        import gc
-        from music21 import volume
-
         n1 = note.Note('G#4')
         v = volume.Volume(client=n1)
         self.assertEqual(v.client, n1)
@@ -22,9 +24,6 @@ class Test(unittest.TestCase):
 
 
     def testGetContextSearchA(self):
-        from music21 import stream
-        from music21 import volume
-
         s = stream.Stream()
         d1 = dynamics.Dynamic('mf')
         s.insert(0, d1)
@@ -41,8 +40,6 @@ class Test(unittest.TestCase):
 
 
     def testGetContextSearchB(self):
-        from music21 import stream
-
         s = stream.Stream()
         d1 = dynamics.Dynamic('mf')
         s.insert(0, d1)
@@ -57,8 +54,6 @@ class Test(unittest.TestCase):
 
 
     def testDeepCopyA(self):
-        import copy
-        from music21 import volume
         n1 = note.Note()
 
         v1 = volume.Volume()
@@ -74,8 +69,6 @@ class Test(unittest.TestCase):
 
 
     def testGetRealizedA(self):
-        from music21 import volume
-
         v1 = volume.Volume(velocity=64)
         self.assertEqual(v1.getRealizedStr(), '0.5')
 
@@ -121,9 +114,6 @@ class Test(unittest.TestCase):
 
 
     def testRealizeVolumeA(self):
-        from music21 import stream
-        from music21 import volume
-
         s = stream.Stream()
         s.repeatAppend(note.Note('g3'), 16)
 
@@ -176,9 +166,6 @@ class Test(unittest.TestCase):
         # s.show('midi')
 
     def testRealizeVolumeB(self):
-        from music21 import corpus
-        from music21 import stream
-
         s = corpus.parse('bwv66.6')
 
         durUnit = s.highestTime // 8  # let floor
@@ -234,8 +221,6 @@ class Test(unittest.TestCase):
 
 
     def testRealizeVolumeC(self):
-        from music21 import stream
-
         s = stream.Stream()
         s.repeatAppend(note.Note('g3'), 16)
 
@@ -17,11 +17,13 @@ print(f"music21 location: {music21.__file__}")
 print(f"music21 version: {music21.__version__}")
 print(f"Is local repo: {current_dir in music21.__file__}")
 
-# You can also check if editable install exists
-try:
+# You can also check if editable install exists; this scans every
+# sys.path entry for dist-info, so only do it when asked
+if os.environ.get('MUSIC21_VERIFY_FULL'):
     import importlib.metadata
-    dist = importlib.metadata.distribution('music21')
-    print(f"\nInstalled via pip: {dist.version}")
-    print(f"Installation location: {dist.locate_file('')}")
-except importlib.metadata.PackageNotFoundError:
-    print("\nNo pip-installed music21 found (good - using local only)")
\ No newline at end of file
+    try:
+        dist = importlib.metadata.distribution('music21')
+        print(f"\nInstalled via pip: {dist.version}")
+        print(f"Installation location: {dist.locate_file('')}")
+    except importlib.metadata.PackageNotFoundError:
+        print("\nNo pip-installed music21 found (good - using local only)")
\ No newline at end of file